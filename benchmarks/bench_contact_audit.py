@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "ex1"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import numpy as np  # noqa: E402
+from pydantic import ValidationError  # noqa: E402
+from alien_contact import AlienContact  # noqa: E402
+from contact_audit import (RULES, AuditRules, ContactBatch,  # noqa: E402
+                           first_violations, violation_codes)
+from contact_prescreen import prescreen  # noqa: E402
+from datagen import generate  # noqa: E402
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    records: list[dict] = list(generate("contact", count))
+
+    start: float = perf_counter()
+    batch: ContactBatch = ContactBatch.from_records(records)
+    loaded: float = perf_counter() - start
+    start = perf_counter()
+    codes: np.ndarray = violation_codes(batch)
+    audited: float = perf_counter() - start
+    first: np.ndarray = first_violations(codes)
+    start = perf_counter()
+    stricter: np.ndarray = violation_codes(
+        batch, AuditRules(telepathic_witnesses=5, strong_signal=6.0))
+    reaudited: float = perf_counter() - start
+    print(f"{count} records: columns in {loaded:.2f}s, rules in"
+          f" {audited * 1000:.0f} ms, again with stricter limits in"
+          f" {reaudited * 1000:.0f} ms")
+    print(f"  rejected {np.count_nonzero(codes)}, with stricter limits"
+          f" {np.count_nonzero(stricter)}")
+
+    # Same rules as the pre-screen, row by row
+    start = perf_counter()
+    screened: list[list[str]] = [[error["type"] for error in prescreen(r)]
+                                 for r in records]
+    print(f"  prescreen() per record: {perf_counter() - start:.2f}s,"
+          " same violations:", all(
+              found == [RULES[bit] for bit in range(len(RULES))
+                        if code >> bit & 1]
+              for found, code in zip(screened, codes.tolist())))
+
+    # And the rule check_values raises, for the sample the model accepts
+    # field-wise; building models is timed on it
+    sample: list[dict] = records[:100_000]
+    start = perf_counter()
+    raised: list[str | None] = []
+    for record in sample:
+        try:
+            AlienContact.model_validate(record)
+            raised.append(None)
+        except ValidationError as error:
+            raised.append(error.errors()[0]["type"])
+    built: float = perf_counter() - start
+    print(f"  model_validate per record: {built / len(sample) * count:.2f}s"
+          f" for {count} (timed on {len(sample)}), same first rule:", all(
+              found == (None if bit < 0 else RULES[bit])
+              for found, bit in zip(raised, first.tolist())
+              if found is None or found in RULES))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import random
+import sys
+from pathlib import Path
+from timeit import timeit
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "ex1"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from contact_cache import MAX_SIZE, ContactCache  # noqa: E402
+from contact_pool import validate_contacts  # noqa: E402
+from datagen import generate  # noqa: E402
+
+
+# A relay feed: `count` reports of which `duplicates` are retransmissions
+# (fresh dict copies) of earlier ones
+def make_feed(count: int, duplicates: float, seed: int = 42) -> list[dict]:
+    rng: random.Random = random.Random(seed)
+    unique: list[dict] = list(generate("contact", max(1, round(
+        count * (1 - duplicates))), seed=seed))
+    feed: list[dict] = unique + [dict(rng.choice(unique))
+                                 for _ in range(count - len(unique))]
+    rng.shuffle(feed)
+    return feed
+
+
+def run(feed: list[dict], maxsize: int) -> tuple[float, dict]:
+    cached: float = float("inf")
+    for _ in range(3):
+        # A cold cache each run, hits only come from the feed itself
+        cache: ContactCache = ContactCache(maxsize)
+        cached = min(cached, timeit(
+            lambda: [cache.validate(report) for report in feed], number=1))
+    return cached, cache.stats()
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{count} reports per feed, best of 3")
+    for duplicates in (0.0, 0.5, 0.75, 0.9):
+        feed: list[dict] = make_feed(count, duplicates)
+        plain: float = min(timeit(lambda: validate_contacts(feed), number=1)
+                           for _ in range(3))
+        cached, stats = run(feed, MAX_SIZE)
+        print(f"{duplicates:4.0%} duplicates: {count / plain:8.0f} rec/s"
+              f" -> {count / cached:8.0f} rec/s cached  x{plain / cached:.2f}"
+              f"  (hits {stats['hits']}, misses {stats['misses']})")
+    # A feed several times larger than the cache: most misses evict
+    feed = make_feed(count, 0.5)
+    plain = min(timeit(lambda: validate_contacts(feed), number=1)
+                for _ in range(3))
+    maxsize: int = max(1, count // 8)
+    cached, stats = run(feed, maxsize)
+    print(f"maxsize {maxsize}, 50% duplicates: {count / plain:8.0f} rec/s"
+          f" -> {count / cached:8.0f} rec/s cached  x{plain / cached:.2f}"
+          f"  (hits {stats['hits']}, evictions {stats['evictions']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import random
+import sys
+from datetime import timedelta
+from pathlib import Path
+from time import perf_counter
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "ex1"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from alien_contact import AlienContact  # noqa: E402
+from contact_events import ContactEvent, cluster_contacts  # noqa: E402
+from datagen import generate  # noqa: E402
+
+TOLERANCE: timedelta = timedelta(minutes=10)
+
+
+def make_reports(sightings: int) -> list[AlienContact]:
+    # Every sighting is reported one to five times, up to five minutes
+    # apart, and the reports arrive in no particular order
+    rng: random.Random = random.Random(42)
+    reports: list[AlienContact] = []
+    for sighting in generate("contact", sightings, invalid_ratio=0):
+        base: AlienContact = AlienContact.model_validate(sighting)
+        for copy in range(rng.randint(1, 5)):
+            reports.append(base.model_copy(update={
+                "contact_id": f"{base.contact_id}_{copy}",
+                "timestamp": base.timestamp + timedelta(
+                    seconds=rng.randrange(300)),
+                "witness_count": rng.randint(3, 100)}))
+    rng.shuffle(reports)
+    return reports
+
+
+def sort_and_sweep(contacts: list[AlienContact]) -> list[list[str]]:
+    # Reference: sort by key and time, cut where the gap is too wide
+    ordered: list[AlienContact] = sorted(contacts, key=lambda c: (
+        c.location, c.contact_type.value, c.timestamp))
+    events: list[list[str]] = []
+    previous: AlienContact | None = None
+    for contact in ordered:
+        if previous is None or previous.location != contact.location\
+                or previous.contact_type != contact.contact_type\
+                or contact.timestamp - previous.timestamp > TOLERANCE:
+            events.append([])
+        events[-1].append(contact.contact_id)
+        previous = contact
+    return events
+
+
+def main() -> None:
+    sightings: int = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    reports: list[AlienContact] = make_reports(sightings)
+
+    start: float = perf_counter()
+    events: list[ContactEvent] = cluster_contacts(reports, TOLERANCE)
+    clustered: float = perf_counter() - start
+    start = perf_counter()
+    reference: list[list[str]] = sort_and_sweep(reports)
+    swept: float = perf_counter() - start
+
+    same: bool = sorted(sorted(event.contact_ids) for event in events)\
+        == sorted(sorted(ids) for ids in reference)
+    witnesses: int = sum(report.witness_count for report in reports)
+    print(f"{len(reports)} reports of {sightings} sightings ->"
+          f" {len(events)} events ({len(reports) / len(events):.2f} reports"
+          f" each, {TOLERANCE} tolerance)")
+    print(f"  bucketed union-find: {clustered:.2f}s"
+          f" ({clustered / len(reports) * 1e6:.2f} us per report)")
+    print(f"  sort and sweep:      {swept:.2f}s")
+    print(f"  same events: {same}, witnesses kept:"
+          f" {sum(event.witnesses for event in events) == witnesses}")
+
+
+if __name__ == "__main__":
+    main()
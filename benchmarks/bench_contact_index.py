@@ -0,0 +1,66 @@
+import random
+import sys
+from datetime import timedelta
+from pathlib import Path
+from time import perf_counter
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "ex1"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from alien_contact import AlienContact, ContactType  # noqa: E402
+from contact_index import ContactIndex  # noqa: E402
+from datagen import EPOCH, LOCATIONS, generate  # noqa: E402
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    contacts: list[AlienContact] = [
+        AlienContact.model_validate(report)
+        for report in generate("contact", count, invalid_ratio=0)]
+    index: ContactIndex = ContactIndex()
+    start: float = perf_counter()
+    index.bulk_load(contacts)
+    print(f"{count} contacts bulk loaded in {perf_counter() - start:.2f}s")
+
+    rng: random.Random = random.Random(42)
+    queries: list[dict] = []
+    for _ in range(200):
+        begin = EPOCH + timedelta(days=rng.randrange(360))
+        queries.append({
+            "start": begin, "end": begin + timedelta(hours=rng.choice(
+                (1, 24, 24 * 7))),
+            "location": rng.choice(LOCATIONS + [None]),
+            "contact_type": rng.choice(list(ContactType) + [None]),
+            "verified": rng.choice((True, False, None))})
+
+    def scan(start, end, location, contact_type, verified) -> list:
+        return sorted((c for c in contacts if start <= c.timestamp <= end
+                       and location in (None, c.location)
+                       and contact_type in (None, c.contact_type)
+                       and verified in (None, c.is_verified)),
+                      key=lambda c: c.timestamp)
+
+    timings: list[float] = []
+    found: int = 0
+    for query in queries:
+        begin_time: float = perf_counter()
+        result: list[AlienContact] = index.query(**query)
+        timings.append(perf_counter() - begin_time)
+        found += len(result)
+    for query in queries[:10]:
+        assert {id(c) for c in index.query(**query)} ==\
+            {id(c) for c in scan(**query)}
+    begin_time = perf_counter()
+    scan(**queries[0])
+    scan_time: float = perf_counter() - begin_time
+    timings.sort()
+    print(f"{len(queries)} queries, {found / len(queries):.0f} contacts"
+          " found on average")
+    print(f"index: p50 {timings[len(timings) // 2] * 1000:.3f} ms,"
+          f" p99 {timings[len(timings) * 99 // 100] * 1000:.3f} ms")
+    print(f"scan : {scan_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
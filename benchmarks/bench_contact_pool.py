@@ -0,0 +1,70 @@
+import sys
+from os import cpu_count
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ex1"))
+
+from contact_pool import (  # noqa: E402
+    validate_contacts,
+    validate_contacts_parallel)
+
+
+VALID: dict = {
+    "contact_id": "AC_001",
+    "timestamp": "1992-10-10",
+    "location": "Uranus",
+    "contact_type": "physical",
+    "signal_strength": 8.2,
+    "duration_minutes": 596,
+    "witness_count": 60,
+    "message_received": "Coucou",
+    "is_verified": True,
+}
+INVALID: dict = {
+    "contact_id": "AC_002",
+    "timestamp": "1992-10-10",
+    "location": "Uranus",
+    "contact_type": "physical",
+    "signal_strength": 8.2,
+    "duration_minutes": 596,
+    "witness_count": 2,
+    "message_received": "",
+    "is_verified": False,
+}
+
+
+def make_reports(count: int, invalid_every: int) -> list:
+    return [INVALID if invalid_every and i % invalid_every == 0 else VALID
+            for i in range(count)]
+
+
+# ValueErrors kept in the error ctx don't compare equal, so compare what
+# the reports show instead
+def summary(results: list) -> list:
+    return [(model, [(error["loc"], error["type"], error["msg"])
+                     for error in errors]) for model, errors in results]
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    chunk_size: int = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    reports: list = make_reports(count, invalid_every=10)
+    start: float = perf_counter()
+    serial: list = validate_contacts(reports)
+    base: float = perf_counter() - start
+    print(f"{count} reports, chunks of {chunk_size}")
+    print(f"serial     : {base:6.2f}s")
+    for workers in sorted({1, 2, 4, cpu_count() or 1}):
+        start = perf_counter()
+        parallel: list = validate_contacts_parallel(reports, workers,
+                                                    chunk_size)
+        elapsed: float = perf_counter() - start
+        same: str = "identical" if summary(parallel) == summary(serial)\
+            else "MISMATCH"
+        print(f"{workers:2} workers : {elapsed:6.2f}s  x{base / elapsed:.2f}"
+              f"  ({same})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+from timeit import timeit
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "ex1"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from contact_pool import validate_contact, validate_contacts  # noqa: E402
+from contact_prescreen import prescreen, validate_screened  # noqa: E402
+from datagen import generate  # noqa: E402
+
+
+def check(reports: list[dict]) -> None:
+    # Never rejects a valid report, and says what check_values says
+    # whenever the fields themselves are fine
+    for report in reports:
+        screened: list = prescreen(report, fail_fast=True)
+        model, errors = validate_contact(report)
+        if not screened:
+            continue
+        assert model is None, report
+        if all(not error["loc"] for error in errors):
+            assert [(e["type"], e["msg"]) for e in screened] ==\
+                [(e["type"], e["msg"]) for e in errors], report
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{count} reports per feed, best of 3")
+    for invalid_ratio in (0.0, 0.5, 0.9):
+        reports: list[dict] = list(generate("contact", count, invalid_ratio))
+        check(reports)
+        rejected: int = sum(bool(prescreen(r, True)) for r in reports)
+        full: float = min(timeit(lambda: validate_contacts(reports),
+                                 number=1) for _ in range(3))
+        screened: float = min(timeit(
+            lambda: [validate_screened(r, fail_fast=True) for r in reports],
+            number=1) for _ in range(3))
+        print(f"{invalid_ratio:4.0%} invalid ({rejected / count:4.0%}"
+              f" pre-screened): full {full * 1000:7.1f} ms,"
+              f" pre-screen {screened * 1000:7.1f} ms  x{full / screened:.2f}")
+
+
+if __name__ == "__main__":
+    main()
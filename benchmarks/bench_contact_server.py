@@ -0,0 +1,79 @@
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from datagen import generate  # noqa: E402
+
+WINDOW: int = 128
+
+
+async def sensor(path: str, reports: list[bytes], latencies: list[float]
+                 ) -> int:
+    # Keeps up to WINDOW reports in flight and times each one from send to
+    # response
+    reader, writer = await asyncio.open_unix_connection(path)
+    sent: list[float] = []
+    rejected: int = 0
+    window: asyncio.Semaphore = asyncio.Semaphore(WINDOW)
+
+    async def send() -> None:
+        for report in reports:
+            await window.acquire()
+            sent.append(perf_counter())
+            writer.write(report)
+            await writer.drain()
+
+    sending: asyncio.Task = asyncio.create_task(send())
+    for index in range(len(reports)):
+        response: dict = json.loads(await reader.readline())
+        latencies.append(perf_counter() - sent[index])
+        rejected += response["status"] == "rejected"
+        window.release()
+    await sending
+    writer.close()
+    return rejected
+
+
+async def load(path: str, sensors: int, per_sensor: int) -> None:
+    reports: list[bytes] = [json.dumps(report).encode() + b"\n"
+                            for report in generate("contact", per_sensor)]
+    latencies: list[float] = []
+    start: float = perf_counter()
+    rejected: list[int] = await asyncio.gather(
+        *(sensor(path, reports, latencies) for _ in range(sensors)))
+    elapsed: float = perf_counter() - start
+    latencies.sort()
+    total: int = sensors * per_sensor
+    print(f"{sensors} sensors x {per_sensor} reports, {sum(rejected)}"
+          f" rejected")
+    print(f"throughput: {total / elapsed:8.0f} reports/s")
+    print(f"latency   : p50 {latencies[total // 2] * 1000:.2f} ms,"
+          f" p99 {latencies[total * 99 // 100] * 1000:.2f} ms,"
+          f" max {latencies[-1] * 1000:.2f} ms")
+
+
+def main() -> None:
+    sensors: int = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    per_sensor: int = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path: str = str(Path(tmp) / "contacts.sock")
+        server: subprocess.Popen = subprocess.Popen(
+            [sys.executable, str(ROOT / "ex1" / "contact_server.py"),
+             "--unix", path], stdout=subprocess.PIPE, text=True)
+        try:
+            server.stdout.readline()
+            asyncio.run(load(path, sensors, per_sensor))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import random
+import sys
+from pathlib import Path
+from timeit import timeit
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+for directory in ("ex2", "benchmarks"):
+    sys.path.insert(0, str(ROOT / directory))
+
+from crew_assignment import (  # noqa: E402
+    MissionSpec,
+    Staffing,
+    assign_crews,
+    staffed_mission)
+from datagen import RANKS, crew_member  # noqa: E402
+from space_crew import CrewMember  # noqa: E402
+
+
+def make_pool(count: int, rng: random.Random) -> list[CrewMember]:
+    # Mostly juniors, a fifth of rookies and a few members on leave
+    members: list[CrewMember] = []
+    for index in range(count):
+        record: dict = crew_member(rng, f"CP{index:06}", rng.choices(
+            RANKS, weights=(30, 30, 20, 12, 8))[0])
+        if rng.random() < 0.2:
+            record["years_experience"] = rng.randint(0, 4)
+        record["is_active"] = rng.random() >= 0.05
+        members.append(CrewMember.model_validate(record))
+    return members
+
+
+def make_specs(count: int, rng: random.Random) -> list[MissionSpec]:
+    specs: list[MissionSpec] = []
+    for index in range(count):
+        low: int = rng.randint(1, 8)
+        specs.append(MissionSpec(f"M2024_{index:06}", rng.randint(30, 1200),
+                                 low, rng.randint(low, 12)))
+    return specs
+
+
+def main() -> None:
+    members_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    missions_count: int = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    rng: random.Random = random.Random(42)
+    members: list[CrewMember] = make_pool(members_count, rng)
+    specs: list[MissionSpec] = make_specs(missions_count, rng)
+    elapsed: float = min(timeit(lambda: assign_crews(members, specs),
+                                number=1) for _ in range(3))
+    staffing: Staffing = assign_crews(members, specs)
+    # Every crew goes through check_mission_elements
+    for spec in specs:
+        if spec.mission_id in staffing.crews:
+            staffed_mission({
+                "mission_id": spec.mission_id,
+                "mission_name": "Assigned Mission",
+                "destination": "Mars",
+                "launch_date": "2024-09-18T00:00:00",
+                "duration_days": spec.duration_days,
+                "budget_millions": 100.0,
+            }, staffing.crews[spec.mission_id])
+    assigned: int = sum(len(crew) for crew in staffing.crews.values())
+    assert assigned + len(staffing.unassigned) == members_count
+    print(f"{members_count} members, {missions_count} missions:"
+          f" {len(staffing.crews)} staffed, {len(staffing.unstaffed)}"
+          f" unstaffed, {assigned} assigned in {elapsed * 1000:.1f} ms")
+    for mission_id, reason in list(staffing.unstaffed.items())[:3]:
+        print(f"  {mission_id}: {reason}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import gc
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Iterator
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "ex2"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from crew_roster import CrewRoster  # noqa: E402
+from datagen import RANKS, crew_member  # noqa: E402
+from space_crew import CrewMember  # noqa: E402
+
+
+def members(count: int, seed: int = 42) -> Iterator[CrewMember]:
+    # One at a time, so the raw dicts never count against either side
+    rng: random.Random = random.Random(seed)
+    for index in range(count):
+        yield CrewMember(**crew_member(rng, f"CM{index:07}",
+                                       rng.choice(RANKS)))
+
+
+def measure(build) -> tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    result: object = build()
+    gc.collect()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    models, model_bytes = measure(lambda: list(members(count)))
+    roster, roster_bytes = measure(
+        lambda: CrewRoster.from_members(members(count)))
+    assert roster.to_members() == models
+    print(f"{count} crew members")
+    print(f"CrewMember list: {model_bytes / count:6.0f} bytes/member")
+    print(f"CrewRoster     : {roster_bytes / count:6.0f} bytes/member"
+          f"  x{model_bytes / roster_bytes:.1f} smaller")
+
+
+if __name__ == "__main__":
+    main()
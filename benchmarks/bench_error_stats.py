@@ -0,0 +1,75 @@
+import io
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+for directory in ("ex0", "ex1", "ex2", "benchmarks"):
+    sys.path.insert(0, str(ROOT / directory))
+sys.path.insert(0, str(ROOT))
+
+from pydantic import ValidationError  # noqa: E402
+from alien_contact import AlienContact  # noqa: E402
+from datagen import generate  # noqa: E402
+from shared.error_stats import ErrorStats  # noqa: E402
+from space_crew import CrewMember  # noqa: E402
+from space_station import StationModel  # noqa: E402
+
+
+# Half of every feed fails: the per-error printing the scripts do, to an
+# in-memory stream, against counting
+def formatted(model, records: list[dict], out: io.StringIO) -> None:
+    for record in records:
+        try:
+            model(**record)
+        except ValidationError as e:
+            print("\nExpected validation error:", file=out)
+            for error in e.errors():
+                loc: str = "" if not error["loc"] else f"{error['loc'][0]}: "
+                print(f"{loc}{error['msg']}", file=out)
+            print("="*60, file=out)
+
+
+def counted(model, records: list[dict], stats: ErrorStats) -> None:
+    name: str = model.__name__
+    for record in records:
+        try:
+            model(**record)
+            stats.accepted(name)
+        except ValidationError as e:
+            stats.add(name, e.errors(include_url=False,
+                                     include_context=False,
+                                     include_input=False), record)
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    feeds: list[tuple] = [
+        (StationModel, list(generate("station", count, 0.5))),
+        (AlienContact, list(generate("contact", count, 0.5))),
+        (CrewMember, [
+            {**member, "age": 95} if index % 2 else member
+            for index, member in enumerate(
+                member for mission in generate("mission", count // 3, 0)
+                for member in mission["crew"])][:count]),
+    ]
+    stats: ErrorStats = ErrorStats()
+    for model, records in feeds:
+        # Schemas are built on first use, keep that out of the timings
+        formatted(model, records[:100], io.StringIO())
+        start: float = perf_counter()
+        formatted(model, records, io.StringIO())
+        old: float = perf_counter() - start
+        stats = ErrorStats()
+        start = perf_counter()
+        counted(model, records, stats)
+        new: float = perf_counter() - start
+        print(f"{model.__name__:<13} {len(records)} records:"
+              f" formatted {old * 1000:7.1f} ms, counted {new * 1000:7.1f} ms"
+              f"  x{old / new:.2f}")
+    print()
+    print(stats.text(), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from timeit import timeit
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+for directory in ("ex0", "ex1", "ex2", "benchmarks"):
+    sys.path.insert(0, str(ROOT / directory))
+sys.path.insert(0, str(ROOT))
+
+from pydantic import BaseModel, TypeAdapter  # noqa: E402
+from alien_contact import AlienContact  # noqa: E402
+from datagen import generate  # noqa: E402
+from shared.interning import Interner  # noqa: E402
+from space_crew import SpaceMission  # noqa: E402
+from space_station import StationModel  # noqa: E402
+
+
+FEEDS: list[tuple[type[BaseModel], str, str]] = [
+    (StationModel, "station", "name"),
+    (AlienContact, "contact", "location"),
+    (SpaceMission, "mission", "destination"),
+]
+
+
+def load(model: type[BaseModel], kind: str, count: int) -> list:
+    # Each line parsed by the json module, as a feed read record by record
+    # would: every string is a fresh copy
+    adapter: TypeAdapter = TypeAdapter(list[model])
+    return adapter.validate_python([
+        json.loads(line) for line in
+        (json.dumps(record) for record in generate(kind, count, 0.0))])
+
+
+def group_plain(models: list, field: str) -> dict:
+    groups: dict = {}
+    for model in models:
+        groups.setdefault(getattr(model, field), []).append(model)
+    return groups
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for model, kind, field in FEEDS:
+        # Traced from the start: the copies interning drops were allocated
+        # while loading
+        tracemalloc.start()
+        models: list = load(model, kind, count)
+        gc.collect()
+        before: int = tracemalloc.get_traced_memory()[0]
+        interner: Interner = Interner()
+        interner.intern(models)
+        gc.collect()
+        freed: int = before - tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        models = load(model, kind, count)
+        plain: float = min(timeit(lambda: group_plain(models, field),
+                                  number=1) for _ in range(3))
+        interner = Interner()
+        interned: float = timeit(lambda: interner.intern(models), number=1)
+        coded: float = min(timeit(lambda: interner.group(models, field),
+                                  number=1) for _ in range(3))
+        shared: float = min(timeit(lambda: group_plain(models, field),
+                                   number=1) for _ in range(3))
+        assert {key: len(group) for key, group in group_plain(
+            models, field).items()} == {key: len(group) for key, group
+                                        in interner.group(
+                                            models, field).items()}
+        print(f"{count} {kind}s: interned in {interned * 1000:.0f} ms,"
+              f" {interner.saved() / 1e6:.1f} MB counted,"
+              f" {freed / 1e6:.1f} MB freed")
+        print(f"  group by {field}: copies {plain * 1000:.1f} ms, interned"
+              f" {shared * 1000:.1f} ms, codes {coded * 1000:.1f} ms")
+        print("  " + interner.report().rstrip().replace("\n", "\n  "))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "ex2"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from pydantic import ValidationError  # noqa: E402
+from datagen import RANKS, generate  # noqa: E402
+from mission_handle import MissionHandle  # noqa: E402
+from space_crew import (  # noqa: E402
+    CrewMember,
+    SpaceMission,
+    mission_rule_violations)
+
+
+def error_types(violations: list) -> list[str]:
+    return [violation.type for violation in violations]
+
+
+# Random roster changes on valid missions. Every change is checked against
+# a full revalidation, then the same changes are timed both ways.
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rng: random.Random = random.Random(42)
+    missions: list[SpaceMission] = [
+        SpaceMission.model_validate(mission)
+        for mission in generate("mission", 200, invalid_ratio=0)]
+    handles: list[MissionHandle] = [MissionHandle(m) for m in missions]
+    changes: list[tuple] = []
+    for step in range(count):
+        handle: MissionHandle = rng.choice(handles)
+        member_id: str = rng.choice(list(handle.members))
+        action: int = rng.randrange(3)
+        if action == 0 and len(handle.members) < 12:
+            change = ("add", CrewMember(
+                member_id=f"NEW{step:06}", name="Elena Garcia",
+                rank=rng.choice(RANKS), age=30, specialization="Pilot",
+                years_experience=rng.randint(0, 30),
+                is_active=rng.random() < 0.9))
+            incremental: list = handle.add(change[1])
+        elif action == 1 and len(handle.members) > 1:
+            change = ("remove", member_id)
+            incremental = handle.remove(member_id)
+        else:
+            change = ("update", member_id, rng.choice([
+                {"is_active": rng.random() < 0.5},
+                {"rank": rng.choice(RANKS)},
+                {"years_experience": rng.randint(0, 30)}]))
+            incremental = handle.update(member_id, **change[2])
+        full: list = mission_rule_violations(
+            handle.mission.duration_days, list(handle.members.values()))
+        assert error_types(incremental) == error_types(full), step
+        changes.append((handles.index(handle), change))
+    print(f"{count} roster changes, all matching a full revalidation")
+
+    handles = [MissionHandle(m) for m in missions]
+    start: float = perf_counter()
+    for index, change in changes:
+        handle = handles[index]
+        if change[0] == "add":
+            handle.add(change[1])
+        elif change[0] == "remove":
+            handle.remove(change[1])
+        else:
+            handle.update(change[1], **change[2])
+    incremental_time: float = perf_counter() - start
+
+    crews: list[dict] = [{m.member_id: m.model_dump() for m in mission.crew}
+                         for mission in missions]
+    start = perf_counter()
+    for index, change in changes:
+        crew: dict = crews[index]
+        if change[0] == "add":
+            crew[change[1].member_id] = change[1].model_dump()
+        elif change[0] == "remove":
+            del crew[change[1]]
+        else:
+            crew[change[1]] = {**crew[change[1]], **change[2]}
+        try:
+            SpaceMission.model_validate({**missions[index].model_dump(),
+                                         "crew": list(crew.values())})
+        except ValidationError:
+            pass
+    rebuild_time: float = perf_counter() - start
+    print(f"incremental: {incremental_time * 1e6 / count:6.1f} us/change")
+    print(f"rebuild    : {rebuild_time * 1e6 / count:6.1f} us/change"
+          f"  x{rebuild_time / incremental_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ex2"))
+
+from pydantic import ValidationError  # noqa: E402
+from space_crew import CrewMember, SpaceMission, ingest_mission  # noqa: E402
+
+
+RANKS: list[str] = ["commander", "captain", "lieutenant", "officer", "cadet"]
+
+
+def make_mission(index: int, crew_size: int) -> dict:
+    return {
+        'mission_id': f'M2024_{index:06}',
+        'mission_name': 'Saturn Rings Research Mission',
+        'destination': 'Saturn Rings',
+        'launch_date': '2024-09-18T00:00:00',
+        'duration_days': 602,
+        'crew': [
+            {
+                'member_id': f'C{index:06}{member:02}',
+                'name': 'Sarah Smith',
+                'rank': RANKS[member % len(RANKS)],
+                'age': 25 + member,
+                'specialization': 'Research',
+                'years_experience': 5 + member,
+                'is_active': True
+            } for member in range(crew_size)
+        ],
+        'mission_status': 'planned',
+        'budget_millions': 1092.6
+    }
+
+
+# The path main() used to take: every member on its own, then the mission
+# rebuilt field by field around the validated crew
+def two_step(mission: dict) -> SpaceMission:
+    validated_crew: list[CrewMember] = []
+    for member in mission["crew"]:
+        try:
+            validated_crew.append(CrewMember(**member))
+        except ValidationError:
+            pass
+    return SpaceMission(
+        mission_id=mission["mission_id"],
+        mission_name=mission["mission_name"],
+        destination=mission["destination"],
+        launch_date=mission["launch_date"],
+        duration_days=mission["duration_days"],
+        crew=validated_crew,
+        mission_status=mission["mission_status"],
+        budget_millions=mission["budget_millions"],
+    )
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"{count} missions, best of 5")
+    for crew_size in (1, 6, 12):
+        missions: list = [make_mission(i, crew_size) for i in range(count)]
+        old: float = min(timeit(lambda: [two_step(m) for m in missions],
+                                number=1) for _ in range(5))
+        new: float = min(timeit(lambda: [ingest_mission(m) for m in missions],
+                                number=1) for _ in range(5))
+        print(f"crew of {crew_size:2}: two-step {old * 1000:7.1f} ms  "
+              f"single pass {new * 1000:7.1f} ms  x{old / new:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ex2"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_mission_ingest import make_mission  # noqa: E402
+from space_crew import MissionRegistry, SpaceMission  # noqa: E402
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    missions: list[SpaceMission] = [
+        SpaceMission.model_validate(make_mission(i, 6)) for i in range(count)]
+    registry: MissionRegistry = MissionRegistry()
+    start: float = perf_counter()
+    for mission in missions:
+        registry.add(mission)
+    elapsed: float = perf_counter() - start
+    print(f"{count} missions, {len(registry.members)} members")
+    print(f"insert     : {elapsed * 1e6 / count:6.2f} us/mission")
+
+    rejected: int = 0
+    start = perf_counter()
+    for mission in missions[::100]:
+        try:
+            registry.add(mission)
+        except ValueError:
+            rejected += 1
+    elapsed = perf_counter() - start
+    print(f"duplicate  : {elapsed * 1e6 / rejected:6.2f} us/mission"
+          f" ({rejected} rejected)")
+
+    member_ids: list[str] = list(registry.assignments)[::7]
+    start = perf_counter()
+    for member_id in member_ids:
+        registry.mission_of(member_id)
+    elapsed = perf_counter() - start
+    print(f"mission_of : {elapsed * 1e9 / len(member_ids):6.0f} ns/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ex2"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from pydantic_core import PydanticCustomError  # noqa: E402
+from bench_mission_ingest import make_mission  # noqa: E402
+from space_crew import (  # noqa: E402
+    Rank,
+    SpaceMission,
+    ingest_mission,
+    mission_rule_violations)
+
+
+# check_mission_elements as it was: up to four walks over the crew
+def multi_pass(mission: SpaceMission) -> None:
+    commander_list = [commander for commander in mission.crew
+                      if commander.rank == Rank.COMMANDER]
+    captain_list = [captain for captain in mission.crew
+                    if captain.rank == Rank.CAPTAIN]
+    if len(commander_list) == 0 and len(captain_list) == 0:
+        raise PydanticCustomError("No leader", "")
+    if mission.duration_days > 365:
+        for member in mission.crew:
+            if member.years_experience < 5:
+                raise PydanticCustomError("Experienceless", "")
+    for member in mission.crew:
+        if not member.is_active:
+            raise PydanticCustomError("Vacation time", "")
+
+
+def single_pass(mission: SpaceMission) -> None:
+    violations = mission_rule_violations(mission.duration_days, mission.crew,
+                                         first_only=True)
+    if violations:
+        raise violations[0]
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    missions: list[SpaceMission] = [ingest_mission(make_mission(i, 12))
+                                    for i in range(count)]
+    print(f"{count} missions of 12, best of 5")
+    old: float = min(timeit(lambda: [multi_pass(m) for m in missions],
+                            number=1) for _ in range(5))
+    new: float = min(timeit(lambda: [single_pass(m) for m in missions],
+                            number=1) for _ in range(5))
+    print(f"multi-pass {old * 1e9 / count:6.0f} ns/mission  "
+          f"single pass {new * 1e9 / count:6.0f} ns/mission  "
+          f"x{old / new:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from timeit import timeit
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+for directory in ("ex0", "ex1", "ex2", "benchmarks"):
+    sys.path.insert(0, str(ROOT / directory))
+sys.path.insert(0, str(ROOT))
+
+from pydantic import BaseModel, ValidationError  # noqa: E402
+from alien_contact import AlienContact  # noqa: E402
+from datagen import generate  # noqa: E402
+from shared import profiling  # noqa: E402
+from space_crew import CrewMember, SpaceMission  # noqa: E402
+from space_station import StationModel  # noqa: E402
+
+
+MODELS: dict[str, type[BaseModel]] = {"station": StationModel,
+                                      "contact": AlienContact,
+                                      "mission": SpaceMission}
+
+CALLS: int = 200_000
+
+
+def validate_all(model: type[BaseModel], records: list[dict]) -> None:
+    for record in records:
+        try:
+            model.model_validate(record)
+        except ValidationError:
+            pass
+
+
+def noop(self: None) -> None:
+    return self
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description="Where validation time goes, per model, field and"
+                    " model validator.")
+    parser.add_argument("count", type=int, nargs="?", default=20_000)
+    parser.add_argument("--dump", metavar="PATH",
+                        help="also write the histograms as JSON")
+    args = parser.parse_args()
+    feeds: dict[str, list[dict]] = {
+        kind: list(generate(kind, args.count)) for kind in MODELS}
+
+    # Disabled, @profiled costs a global lookup and a call per validation
+    for kind, model in MODELS.items():
+        validate_all(model, feeds[kind][:10])
+    off: float = min(timeit(lambda: validate_all(
+        AlienContact, feeds["contact"]), number=1) for _ in range(3))
+    wrapped = profiling.profiled(noop)
+    wrapper: float = min(timeit(lambda: wrapped(None), number=CALLS)
+                         for _ in range(7))
+    bare: float = min(timeit(lambda: noop(None), number=CALLS)
+                      for _ in range(7))
+    print(f"profiling off: {off / args.count * 1e6:.2f} us per contact,"
+          f" @profiled adds {(wrapper - bare) / CALLS * 1e9:.0f} ns"
+          " per model validator call\n")
+
+    profiler: profiling.ValidationProfiler = profiling.enable()
+    for kind, model in MODELS.items():
+        for record in feeds[kind]:
+            try:
+                profiler.validate(model, record)
+            except ValidationError:
+                pass
+            profiler.profile_fields(model, record)
+        if model is SpaceMission:
+            for record in feeds[kind]:
+                for member in record["crew"]:
+                    profiler.profile_fields(CrewMember, member)
+    profiling.disable()
+    print(profiler.report(), end="")
+    if args.dump:
+        with open(args.dump, "w") as dump:
+            dump.write(profiler.dump())
+
+
+if __name__ == "__main__":
+    main()
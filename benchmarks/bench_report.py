@@ -0,0 +1,61 @@
+import os
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+from timeit import timeit
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "ex0"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from bench_station_store import make_fleet  # noqa: E402
+from shared.report import MODES, ReportWriter  # noqa: E402
+from space_station import (  # noqa: E402
+    StationModel,
+    station_error_text,
+    station_text)
+
+
+# What main() used to do for every valid station
+def print_path(fleet: list[StationModel]) -> None:
+    for model in fleet:
+        status: str = "Operational" if model.is_operational else\
+                      "Non-operational"
+        print()
+        print("Valid station created:")
+        print("ID:", model.station_id)
+        print("Name:", model.name)
+        print(f"Crew: {model.crew_size} people")
+        print(f"Power: {model.power_level}%")
+        print(f"Oxygen: {model.oxygen_level}%")
+        print("Status:", status)
+        print()
+
+
+def writer_path(fleet: list[StationModel], mode: str) -> None:
+    with ReportWriter(StationModel, station_text, station_error_text,
+                      mode) as report:
+        for index, model in enumerate(fleet):
+            report.accepted(index, model)
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    fleet: list[StationModel] = make_fleet(count)
+    print(f"{count} stations to a line-buffered /dev/null (like a terminal)")
+    # buffering=1 flushes, so issues a write(), on every newline
+    with open(os.devnull, "w", buffering=1) as devnull:
+        with redirect_stdout(devnull):
+            old: float = timeit(lambda: print_path(fleet), number=1)
+            times: dict[str, float] = {
+                mode: timeit(lambda: writer_path(fleet, mode), number=1)
+                for mode in MODES}
+    print(f"print calls     : {old * 1000:7.1f} ms")
+    for mode, elapsed in times.items():
+        print(f"writer {mode:<9}: {elapsed * 1000:7.1f} ms"
+              f"  x{old / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
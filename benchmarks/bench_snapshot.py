@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from timeit import timeit
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+for directory in ("ex0", "ex2", "benchmarks"):
+    sys.path.insert(0, str(ROOT / directory))
+sys.path.insert(0, str(ROOT))
+
+from pydantic import TypeAdapter  # noqa: E402
+from datagen import generate  # noqa: E402
+from mission_snapshot import load_missions, save_missions  # noqa: E402
+from space_crew import SpaceMission  # noqa: E402
+from space_station import StationModel  # noqa: E402
+from station_snapshot import load_stations, save_stations  # noqa: E402
+
+
+# A restart in a fresh interpreter: imports, schema build (the models are
+# defer_build) and the reload itself
+RESTART: str = """
+import sys
+from time import perf_counter
+start = perf_counter()
+sys.path[:0] = {path!r}
+{reload}
+print(perf_counter() - start)
+"""
+FROM_JSON: str = """
+from pydantic import TypeAdapter
+from {module} import {model}
+with open({file!r}, "rb") as dump:
+    TypeAdapter(list[{model}]).validate_json(dump.read())
+"""
+FROM_SNAPSHOT: str = """
+from {module} import {load}
+{load}({file!r})
+"""
+
+
+def restart(reload: str) -> float:
+    code: str = RESTART.format(path=[str(ROOT / "ex0"), str(ROOT / "ex2"),
+                                     str(ROOT)], reload=reload)
+    return min(float(subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+        check=True).stdout) for _ in range(3))
+
+
+# Reloading a validated fleet: its JSON dump validated again against the
+# snapshot read back through mmap
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    directory: str = tempfile.mkdtemp()
+    for model, kind, module, save, load in (
+            (StationModel, "station", "space_station", save_stations,
+             load_stations),
+            (SpaceMission, "mission", "space_crew", save_missions,
+             load_missions)):
+        adapter: TypeAdapter = TypeAdapter(list[model])
+        fleet: list = adapter.validate_python(
+            list(generate(kind, count, invalid_ratio=0.0)))
+        dumped: bytes = adapter.dump_json(fleet)
+        path: str = os.path.join(directory, f"{kind}.snap")
+        written: float = timeit(lambda: save(path, fleet), number=1)
+        assert load(path) == fleet
+        old: float = min(timeit(lambda: adapter.validate_json(dumped),
+                                number=1) for _ in range(3))
+        new: float = min(timeit(lambda: load(path), number=1)
+                         for _ in range(3))
+        print(f"{count} {kind}s  json {len(dumped) / 1e6:5.1f} MB"
+              f" {old * 1000:7.0f} ms  snapshot"
+              f" {os.path.getsize(path) / 1e6:5.1f} MB {new * 1000:7.0f} ms"
+              f"  x{old / new:.1f}  (saved in {written * 1000:.0f} ms)")
+        json_path: str = os.path.join(directory, f"{kind}.json")
+        with open(json_path, "wb") as dump:
+            dump.write(dumped)
+        old = restart(FROM_JSON.format(module=module, model=model.__name__,
+                                       file=json_path))
+        new = restart(FROM_SNAPSHOT.format(module=load.__module__,
+                                           load=load.__name__, file=path))
+        print(f"{'restart':>{len(str(count)) + len(kind) + 3}}  json"
+              f" {old * 1000:7.0f} ms  snapshot {new * 1000:7.0f} ms"
+              f"  x{old / new:.1f}")
+        os.remove(json_path)
+        os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
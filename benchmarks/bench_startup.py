@@ -0,0 +1,82 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+# Milliseconds our own code may add at startup once pydantic's model
+# machinery is loaded (best of several fresh interpreters). Generous
+# enough for a loaded box, tight enough to catch schemas built at import
+# time again.
+IMPORT_BUDGET_MS: float = 15
+HELP_BUDGET_MS: float = 30
+
+# Loads what any BaseModel subclass pulls in, without building a schema,
+# so that only the script's own cost is timed.
+WARM_UP: str = """
+import time
+from pydantic import BaseModel, ConfigDict
+class _Warm(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    x: int
+start = time.perf_counter()
+"""
+
+SCRIPTS: dict[str, tuple[str, str, str]] = {
+    "ex0": ("space_station", "space_station.py",
+            "StationModel.model_validate({'station_id': 'LGW125', 'name':"
+            " 'Titan', 'crew_size': 6, 'power_level': 76.4, 'oxygen_level':"
+            " 95.5, 'last_maintenance': '2023-07-11'})"),
+    "ex1": ("alien_contact", "alien_contact.py",
+            "AlienContact.model_validate({'contact_id': 'AC_001',"
+            " 'timestamp': '1992-10-10', 'location': 'Uranus',"
+            " 'contact_type': 'radio', 'signal_strength': 2.2,"
+            " 'duration_minutes': 5, 'witness_count': 6})"),
+    "ex2": ("space_crew", "space_crew.py",
+            "CrewMember.model_validate({'member_id': 'CM001', 'name':"
+            " 'Sarah Williams', 'rank': 'captain', 'age': 43,"
+            " 'specialization': 'Pilot', 'years_experience': 19})"),
+}
+
+
+def run_ms(code: str, cwd: Path, runs: int) -> float:
+    snippet: str = (WARM_UP + code
+                    + "\nprint((time.perf_counter() - start) * 1000)")
+    return min(float(subprocess.run(
+        [sys.executable, "-c", snippet], cwd=cwd, check=True,
+        capture_output=True, text=True).stdout.splitlines()[-1])
+               for _ in range(runs))
+
+
+def main() -> None:
+    runs: int = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    print(f"Startup cost on top of pydantic, best of {runs} runs")
+    over: list[str] = []
+    for directory, (module, script, record) in SCRIPTS.items():
+        cwd: Path = ROOT / directory
+        help_run: str = (f"import runpy, sys\nsys.argv = ['{script}',"
+                         f" '--help']\ntry:\n    runpy.run_path('{script}',"
+                         " run_name='__main__')\nexcept SystemExit:\n"
+                         "    pass")
+        checks: dict[str, tuple[float, float | None]] = {
+            "import": (run_ms(f"import {module}", cwd, runs),
+                       IMPORT_BUDGET_MS),
+            "--help": (run_ms(help_run, cwd, runs), HELP_BUDGET_MS),
+            "1 record": (run_ms(f"from {module} import *\n{record}", cwd,
+                                runs), None),
+        }
+        for label, (elapsed, budget) in checks.items():
+            verdict: str = ""
+            if budget is not None:
+                verdict = f"  budget {budget:.0f} ms"
+                if elapsed > budget:
+                    verdict += "  OVER"
+                    over.append(f"{script} {label}")
+            print(f"{script:<17} {label:<9}: {elapsed:6.1f} ms{verdict}")
+    if over:
+        print(f"Over budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
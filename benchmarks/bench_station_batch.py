@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ex0"))
+
+from pydantic import ValidationError  # noqa: E402
+from space_station import StationModel, validate_stations  # noqa: E402
+
+
+VALID: dict = {
+    'station_id': 'LGW125',
+    'name': 'Titan Mining Outpost',
+    'crew_size': 6,
+    'power_level': 76.4,
+    'oxygen_level': 95.5,
+    'last_maintenance': '2023-07-11T00:00:00',
+    'is_operational': True,
+    'notes': None
+}
+INVALID: dict = {
+    "station_id": 15,
+    "name": "coucou",
+    "crew_size": 22,
+    "power_level": 0.5,
+    "oxygen_level": 101,
+    "last_maintenance": "10/10/1992",
+    "is_operational": "oui",
+    "notes": "Un truc"
+}
+
+
+def make_stations(count: int, invalid_every: int) -> list:
+    return [INVALID if invalid_every and i % invalid_every == 0 else VALID
+            for i in range(count)]
+
+
+# The loop main() used to run, minus the printing
+def loop_validate(stations: list) -> tuple[list, dict]:
+    valid: list[StationModel] = []
+    errors: dict = {}
+    for index, station in enumerate(stations):
+        try:
+            valid.append(StationModel(**station))
+        except ValidationError as e:
+            errors[index] = e.errors()
+    return valid, errors
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    repeat: int = 5
+    print(f"{count} stations, best of {repeat}")
+    for label, invalid_every in (("all valid", 0), ("10% invalid", 10),
+                                 ("50% invalid", 2)):
+        stations: list = make_stations(count, invalid_every)
+        loop: float = min(timeit(lambda: loop_validate(stations), number=1)
+                          for _ in range(repeat))
+        batch: float = min(timeit(lambda: validate_stations(stations),
+                                  number=1) for _ in range(repeat))
+        print(f"{label:<12} loop: {loop * 1000:8.1f} ms  "
+              f"batch: {batch * 1000:8.1f} ms  x{loop / batch:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import random
+import sys
+from pathlib import Path
+from timeit import timeit
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+for directory in ("ex0", "benchmarks"):
+    sys.path.insert(0, str(ROOT / directory))
+
+from datagen import station  # noqa: E402
+from space_station import validate_stations  # noqa: E402
+from station_delta import ChangeSet, DeltaIngestor  # noqa: E402
+
+
+def make_cycle(fleet: list[dict], changes: int, rng: random.Random
+               ) -> list[dict]:
+    # Fresh dicts every cycle, as a feed would send them
+    records: list[dict] = [dict(record) for record in fleet]
+    for index in rng.sample(range(len(records)), changes):
+        records[index]["oxygen_level"] = round(rng.uniform(80, 100), 1)
+    return records
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng: random.Random = random.Random(42)
+    fleet: list[dict] = []
+    for index in range(count):
+        record: dict = station(rng, index, True)
+        record["station_id"] = f"ST{index:07}"
+        fleet.append(record)
+    ingestor: DeltaIngestor = DeltaIngestor()
+    first: ChangeSet = ingestor.cycle(fleet)
+    assert len(first.added) == count
+    for ratio in (0.0, 0.01, 0.1, 1.0):
+        cycles: list[list[dict]] = [
+            make_cycle(fleet, int(count * ratio), rng) for _ in range(3)]
+        full: float = min(timeit(lambda: validate_stations(records),
+                                 number=1) for records in cycles)
+        delta: float = min(timeit(lambda: ingestor.cycle(records),
+                                  number=1) for records in cycles)
+        changes: ChangeSet = ingestor.cycle(make_cycle(
+            fleet, int(count * ratio), rng))
+        print(f"{count} stations, {ratio:4.0%} changed: full"
+              f" {full * 1000:7.1f} ms  delta {delta * 1000:7.1f} ms"
+              f"  x{full / delta:.1f}  ({len(changes.changed)} changed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+for directory in ("ex0", "benchmarks"):
+    sys.path.insert(0, str(ROOT / directory))
+
+from space_station import StationModel  # noqa: E402
+from station_monitor import Alert, HealthMonitor  # noqa: E402
+
+
+def make_cycle(bases: list[tuple[float, float]], second: int,
+               rng: random.Random) -> list[StationModel]:
+    # Built without validation: the monitor is fed validated models, only
+    # its own cost is timed. Readings wobble around each station's level,
+    # one station in a hundred is losing oxygen and one in a thousand is
+    # down.
+    construct = StationModel.model_construct
+    return [construct(
+        station_id=f"ST{index:07}", name="Deep Space Observatory",
+        crew_size=5,
+        power_level=power + rng.uniform(-0.3, 0.3),
+        oxygen_level=oxygen - second if index % 100 == 0
+        else oxygen + rng.uniform(-0.3, 0.3),
+        last_maintenance=None, is_operational=index % 1000 != 1,
+        notes=None) for index, (oxygen, power) in enumerate(bases)]
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    seconds: int = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    for label, monitor, timed in (
+            ("60 updates", HealthMonitor(), False),
+            ("30 seconds", HealthMonitor(window=None, span=30), True)):
+        rng: random.Random = random.Random(42)
+        bases: list[tuple[float, float]] = [
+            (rng.uniform(90, 99), rng.uniform(80, 99)) for _ in range(count)]
+        times: list[float] = []
+        alerts: list[Alert] = []
+        for second in range(seconds):
+            stations: list[StationModel] = make_cycle(bases, second, rng)
+            start: float = perf_counter()
+            alerts += monitor.cycle(stations, second if timed else None)
+            times.append(perf_counter() - start)
+        kinds: dict[str, int] = {}
+        for alert in alerts:
+            kinds[alert.kind] = kinds.get(alert.kind, 0) + 1
+        steady: list[float] = times[1:]
+        print(f"{count} stations x {seconds} cycles, window {label}: first"
+              f" {times[0] * 1000:.0f} ms, then mean"
+              f" {sum(steady) / len(steady) * 1000:.0f} ms, worst"
+              f" {max(steady) * 1000:.0f} ms"
+              f" ({sum(steady) / len(steady) / count * 1e6:.2f} us per"
+              f" update)\n  alerts {kinds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import random
+import sys
+from pathlib import Path
+from timeit import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ex0"))
+
+from space_station import StationModel, validate_stations  # noqa: E402
+from station_store import StationStore  # noqa: E402
+
+
+def make_fleet(count: int, seed: int = 42) -> list[StationModel]:
+    rng: random.Random = random.Random(seed)
+    stations, _ = validate_stations([{
+        'station_id': f'ST{i:07}',
+        'name': 'Deep Space Observatory',
+        'crew_size': rng.randint(1, 20),
+        'power_level': round(rng.uniform(60, 100), 1),
+        'oxygen_level': round(rng.uniform(80, 100), 1),
+        'last_maintenance': f'2023-{rng.randint(1, 12):02}-11',
+        'is_operational': rng.random() < 0.7,
+        'notes': 'System diagnostics required'
+    } for i in range(count)])
+    return stations
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    fleet: list[StationModel] = make_fleet(count)
+    build: float = timeit(lambda: StationStore.from_models(fleet), number=1)
+    store: StationStore = StationStore.from_models(fleet)
+    print(f"{count} stations, packed in {build * 1000:.0f} ms")
+
+    def scan() -> list[StationModel]:
+        return [s for s in fleet if s.is_operational
+                and s.oxygen_level < 90 and s.power_level < 80]
+
+    def query() -> StationStore:
+        return store.select(store.is_operational
+                            & (store.oxygen_level < 90)
+                            & (store.power_level < 80))
+
+    assert [s.station_id for s in scan()] == query().station_id.tolist()
+    for label, objects, columns in (
+            ("filter", scan,
+             query),
+            ("sort by oxygen", lambda: sorted(
+                fleet, key=lambda s: s.oxygen_level),
+             lambda: store.sort("oxygen_level")),
+            ("mean power", lambda: sum(s.power_level for s in fleet) / count,
+             lambda: store.power_level.mean(dtype="float64"))):
+        old: float = min(timeit(objects, number=1) for _ in range(3))
+        new: float = min(timeit(columns, number=1) for _ in range(3))
+        print(f"{label:<15} models {old * 1000:7.1f} ms  columns"
+              f" {new * 1000:7.1f} ms  x{old / new:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from bench_station_batch import make_stations  # noqa: E402
+
+
+# Runs the streaming reader in a fresh process on growing feeds: throughput
+# should stay flat and peak RSS shouldn't move with the file size.
+def main() -> None:
+    sizes: list[int] = [int(arg) for arg in sys.argv[1:]] or [
+        10_000, 100_000, 1_000_000]
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path: Path = Path(tmp) / f"stations_{size}.ndjson"
+            with open(path, "w") as feed:
+                for station in make_stations(size, invalid_every=10):
+                    feed.write(json.dumps(station) + "\n")
+            report: list[str] = subprocess.run(
+                [sys.executable, str(ROOT / "ex0" / "station_stream.py"),
+                 str(path)], capture_output=True, text=True,
+                check=True).stdout.splitlines()
+            mb: float = path.stat().st_size / (1 << 20)
+            print(f"{size} records ({mb:.0f} MB):")
+            for line in report[-3:]:
+                print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Iterator
+
+
+# Vocabularies taken from the sample records in each main()
+STATION_NAMES: list[str] = [
+    "Titan Mining Outpost", "Deep Space Observatory",
+    "Europa Research Station", "Mars Orbital Platform", "Solar Wind Monitor",
+    "Asteroid Belt Relay"]
+STATION_PREFIXES: list[str] = ["LGW", "QCH", "ISS", "ERS", "ABR"]
+STATION_NOTES: list[str | None] = [
+    None, "System diagnostics required", "All systems nominal"]
+
+LOCATIONS: list[str] = ["Uranus", "Area 51", "Roswell", "Mars", "Europa",
+                        "Nevada Desert", "Atlantic Ocean"]
+CONTACT_TYPES: list[str] = ["radio", "visual", "physical", "telepathic"]
+MESSAGES: list[str] = ["Coucou", "Greetings from Zeta Reticuli",
+                       "Calculus is the key", "We come in peace"]
+
+FIRST_NAMES: list[str] = ["Sarah", "James", "Anna", "David", "Maria",
+                          "Emma", "John", "Sofia", "Lisa", "Michael",
+                          "Elena", "William"]
+LAST_NAMES: list[str] = ["Williams", "Hernandez", "Jones", "Smith", "Brown",
+                         "Rodriguez", "Lopez", "Garcia", "Johnson", "Davis"]
+RANKS: list[str] = ["cadet", "officer", "lieutenant", "captain",
+                    "commander"]
+SPECIALIZATIONS: list[str] = [
+    "Mission Command", "Pilot", "Communications", "Security", "Research",
+    "Science Officer", "Life Support", "Systems Analysis", "Medical Officer",
+    "Engineering", "Maintenance"]
+DESTINATIONS: list[str] = ["Solar Observatory", "Jupiter Orbit", "Europa",
+                           "Mars", "Saturn Rings", "Titan"]
+
+EPOCH: datetime = datetime(2023, 1, 1)
+
+
+def _day(rng: random.Random) -> str:
+    return (EPOCH + timedelta(days=rng.randrange(365))).isoformat()
+
+
+def station(rng: random.Random, index: int, valid: bool) -> dict:
+    record: dict = {
+        "station_id": f"{rng.choice(STATION_PREFIXES)}{index % 1000:03}",
+        "name": rng.choice(STATION_NAMES),
+        "crew_size": rng.randint(1, 20),
+        "power_level": round(rng.uniform(60, 100), 1),
+        "oxygen_level": round(rng.uniform(80, 100), 1),
+        "last_maintenance": _day(rng),
+        "is_operational": rng.random() < 0.6,
+        "notes": rng.choice(STATION_NOTES),
+    }
+    if not valid:
+        # The faults of the first sample station, one at a time
+        field, value = rng.choice([
+            ("station_id", index), ("crew_size", 22), ("oxygen_level", 101),
+            ("last_maintenance", "10/10/1992"), ("is_operational", "oui")])
+        record[field] = value
+    return record
+
+
+def contact(rng: random.Random, index: int, valid: bool) -> dict:
+    contact_type: str = rng.choice(CONTACT_TYPES)
+    signal: float = round(rng.uniform(0, 10), 1)
+    record: dict = {
+        "contact_id": f"AC_{index:06}",
+        "timestamp": (EPOCH + timedelta(
+            minutes=rng.randrange(525_600))).isoformat(),
+        "location": rng.choice(LOCATIONS),
+        "contact_type": contact_type,
+        "signal_strength": signal,
+        "duration_minutes": rng.randint(1, 1440),
+        "witness_count": rng.randint(3, 100),
+        "message_received": rng.choice(MESSAGES) if signal > 7.0
+        or rng.random() < 0.5 else "",
+        "is_verified": contact_type == "physical" or rng.random() < 0.5,
+    }
+    if not valid:
+        # Either a field fault or one of the check_values rules
+        fault: int = rng.randrange(6)
+        if fault == 0:
+            record["contact_id"] = f"XX_{index:06}"
+        elif fault == 1:
+            record["contact_type"] = "physical"
+            record["is_verified"] = False
+        elif fault == 2:
+            record["contact_type"] = "telepathic"
+            record["witness_count"] = rng.randint(1, 2)
+        elif fault == 3:
+            record["signal_strength"] = round(rng.uniform(7.1, 10), 1)
+            record["message_received"] = ""
+        elif fault == 4:
+            record["timestamp"] = "1992/10/10"
+        else:
+            record["witness_count"] = 103
+    return record
+
+
+def crew_member(rng: random.Random, member_id: str, rank: str) -> dict:
+    return {
+        "member_id": member_id,
+        "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        "rank": rank,
+        "age": rng.randint(25, 60),
+        "specialization": rng.choice(SPECIALIZATIONS),
+        "years_experience": rng.randint(5, 30),
+        "is_active": True,
+    }
+
+
+def mission(rng: random.Random, index: int, valid: bool) -> dict:
+    size: int = rng.randint(1, 12)
+    ranks: list[str] = [rng.choice(("captain", "commander"))] + [
+        rng.choice(RANKS) for _ in range(size - 1)]
+    record: dict = {
+        "mission_id": f"M2024_{index:06}",
+        "mission_name": f"{rng.choice(DESTINATIONS)} Research Mission",
+        "destination": rng.choice(DESTINATIONS),
+        "launch_date": _day(rng),
+        "duration_days": rng.randint(30, 1200),
+        "crew": [crew_member(rng, f"CM{index:06}{member:02}", rank)
+                 for member, rank in enumerate(ranks)],
+        "mission_status": "planned",
+        "budget_millions": round(rng.uniform(1, 5000), 1),
+    }
+    if not valid:
+        # The faults of the sample missions: no leader, a rookie on a long
+        # mission, someone on vacation, or a bad member field
+        crew: list[dict] = record["crew"]
+        fault: int = rng.randrange(4)
+        if fault == 0:
+            for member in crew:
+                member["rank"] = rng.choice(("cadet", "officer",
+                                             "lieutenant"))
+        elif fault == 1:
+            record["duration_days"] = rng.randint(366, 1200)
+            rng.choice(crew)["years_experience"] = rng.randint(0, 4)
+        elif fault == 2:
+            rng.choice(crew)["is_active"] = False
+        else:
+            rng.choice(crew)["age"] = rng.choice((12, 95))
+    return record
+
+
+GENERATORS: dict[str, Callable[[random.Random, int, bool], dict]] = {
+    "station": station,
+    "contact": contact,
+    "mission": mission,
+}
+
+
+def generate(kind: str, count: int, invalid_ratio: float = 0.2,
+             seed: int = 42) -> Iterator[dict]:
+    """Yield `count` raw records of `kind` (station, contact or mission).
+
+    The same seed always gives the same records; about `invalid_ratio` of
+    them break one validation rule.
+    """
+    rng: random.Random = random.Random(seed)
+    make: Callable[[random.Random, int, bool], dict] = GENERATORS[kind]
+    for index in range(count):
+        yield make(rng, index, rng.random() >= invalid_ratio)
@@ -0,0 +1,127 @@
+import json
+import platform
+import resource
+import subprocess
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter, perf_counter_ns
+from typing import Any, Callable
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+for directory in ("ex0", "ex1", "ex2", "benchmarks"):
+    sys.path.insert(0, str(ROOT / directory))
+
+from datagen import generate  # noqa: E402
+
+SIZES: list[int] = [1_000, 100_000, 1_000_000]
+
+
+def load_model(kind: str) -> Callable[..., Any]:
+    # Imported here so that each case only builds the schema it times
+    if kind == "station":
+        from space_station import StationModel
+        return StationModel
+    if kind == "contact":
+        from alien_contact import AlienContact
+        return AlienContact
+    from space_crew import SpaceMission
+    return SpaceMission
+
+
+def peak_rss_mb() -> float:
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20 if sys.platform == "darwin" else 1 << 10)
+
+
+def run_case(kind: str, count: int, invalid_ratio: float, seed: int
+             ) -> dict:
+    from pydantic import ValidationError
+
+    model: Callable[..., Any] = load_model(kind)
+    records: list[dict] = list(generate(kind, count, invalid_ratio, seed))
+    # Schemas are built on first use, keep that out of the timings
+    try:
+        model(**records[0])
+    except ValidationError:
+        pass
+    latencies: list[int] = [0] * count
+    valid: list = []
+    rejected: int = 0
+    start: float = perf_counter()
+    # Same path as the scripts: one model(**record) per record
+    for index, record in enumerate(records):
+        begin: int = perf_counter_ns()
+        try:
+            valid.append(model(**record))
+        except ValidationError:
+            rejected += 1
+        latencies[index] = perf_counter_ns() - begin
+    elapsed: float = perf_counter() - start
+    latencies.sort()
+    return {
+        "model": kind,
+        "records": count,
+        "rejected": rejected,
+        "seconds": round(elapsed, 4),
+        "records_per_s": round(count / elapsed),
+        "p50_us": round(latencies[count // 2] / 1000, 2),
+        "p99_us": round(latencies[min(count - 1, count * 99 // 100)] / 1000,
+                        2),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description="Scaling benchmark of StationModel, AlienContact and"
+                    " SpaceMission validation.")
+    parser.add_argument("--models", nargs="+",
+                        choices=["station", "contact", "mission"],
+                        default=["station", "contact", "mission"])
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--invalid-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path,
+                        default=Path("bench_results.json"),
+                        help="JSON file the results are written to")
+    parser.add_argument("--case", nargs=2, metavar=("MODEL", "SIZE"),
+                        help=("run a single case in this process and print"
+                              " it as JSON (used internally)"))
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case[0], int(args.case[1]),
+                                  args.invalid_ratio, args.seed)))
+        return
+
+    results: list[dict] = []
+    print(f"{'model':<8} {'records':>9} {'rec/s':>9} {'p50 us':>8}"
+          f" {'p99 us':>8} {'peak MB':>8}")
+    for kind in args.models:
+        for size in args.sizes:
+            # A fresh process per case keeps peak RSS per case
+            output: str = subprocess.run(
+                [sys.executable, __file__, "--case", kind, str(size),
+                 "--invalid-ratio", str(args.invalid_ratio),
+                 "--seed", str(args.seed)],
+                check=True, capture_output=True, text=True).stdout
+            result: dict = json.loads(output)
+            results.append(result)
+            print(f"{kind:<8} {size:>9} {result['records_per_s']:>9}"
+                  f" {result['p50_us']:>8} {result['p99_us']:>8}"
+                  f" {result['peak_rss_mb']:>8}")
+    args.output.write_text(json.dumps({
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pydantic": __import__("pydantic").VERSION,
+        "seed": args.seed,
+        "invalid_ratio": args.invalid_ratio,
+        "results": results,
+    }, indent=2) + "\n")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
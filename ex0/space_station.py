@@ -1,7 +1,19 @@
 try:
     import sys
-    from pydantic import BaseModel, Field, ValidationError
+    from pathlib import Path
+    from typing import Annotated, Any
+    from pydantic import (
+        BaseModel,
+        ConfigDict,
+        Field,
+        TypeAdapter,
+        ValidationError,
+        ValidatorFunctionWrapHandler,
+        WrapValidator)
+    from pydantic_core import ErrorDetails
     from datetime import date
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from shared.report import MODES, ReportWriter, error_lines
 except (ImportError, ModuleNotFoundError):
     print("Pydantic librairy is missing.\nMake sure you are in a virtual"
           " environment, then download it by typing the command:")
@@ -10,6 +22,9 @@ except (ImportError, ModuleNotFoundError):
 
 
 class StationModel(BaseModel):
+    # The schema is built on first use rather than at import time
+    model_config = ConfigDict(defer_build=True)
+
     station_id: str = Field(max_length=10, min_length=3)
     name: str = Field(max_length=50, min_length=1)
     crew_size: int = Field(le=20, ge=1)
@@ -20,9 +35,93 @@ class StationModel(BaseModel):
     notes: str | None = Field("", max_length=200)
 
 
+class _Rejected:
+    __slots__ = ("error",)
+
+    def __init__(self, error: ValidationError) -> None:
+        self.error = error
+
+
+def _capture_errors(station: Any, handler: ValidatorFunctionWrapHandler
+                    ) -> StationModel | _Rejected:
+    # A failing record must not abort the whole list: its error is kept in
+    # place and the list validator moves on to the next one.
+    try:
+        return handler(station)
+    except ValidationError as e:
+        return _Rejected(e)
+
+
+# Compiled once, on the first batch: a whole batch goes through
+# pydantic-core in a single call instead of one StationModel(**station) per
+# record.
+STATION_LIST_ADAPTER: TypeAdapter[list] = TypeAdapter(
+    list[Annotated[StationModel, WrapValidator(_capture_errors)]],
+    config=ConfigDict(defer_build=True))
+
+
+def validate_stations(stations: list, include_context: bool = True,
+                      include_input: bool = True
+                      ) -> tuple[list[StationModel],
+                                 dict[int, list[ErrorDetails]]]:
+    """Validate a batch of raw stations in one call.
+
+    Returns the valid models in input order and the errors of every rejected
+    record, keyed by its index in `stations`. include_context and
+    include_input are passed on to ValidationError.errors().
+    """
+    valid: list[StationModel] = []
+    errors: dict[int, list[ErrorDetails]] = {}
+    for index, result in enumerate(
+            STATION_LIST_ADAPTER.validate_python(stations)):
+        if type(result) is _Rejected:
+            errors[index] = result.error.errors(
+                include_url=False, include_context=include_context,
+                include_input=include_input)
+        else:
+            valid.append(result)
+    return valid, errors
+
+
+def station_text(model: StationModel) -> str:
+    status: str = "Operational" if model.is_operational else\
+                  "Non-operational"
+    return ("\nValid station created:\n"
+            f"ID: {model.station_id}\n"
+            f"Name: {model.name}\n"
+            f"Crew: {model.crew_size} people\n"
+            f"Power: {model.power_level}%\n"
+            f"Oxygen: {model.oxygen_level}%\n"
+            f"Status: {status}\n\n")
+
+
+def station_error_text(name: str, errors: list[ErrorDetails]) -> str:
+    return f"\nExpected validation error:\n{error_lines(errors)}\n{'='*60}\n"
+
+
+def report_stations(stations: list, report: ReportWriter,
+                    first_index: int = 0) -> None:
+    valid, errors = validate_stations(stations, **report.error_options)
+    models = iter(valid)
+    for index in range(len(stations)):
+        if index in errors:
+            report.rejected(first_index + index, errors[index],
+                            record=stations[index])
+        else:
+            report.accepted(first_index + index, next(models))
+
+
 def main() -> None:
-    print("\nSpace Station Data Validation")
-    print("========================================")
+    # Only needed when run as a script, not worth it on import
+    from argparse import ArgumentParser
+    parser: ArgumentParser = ArgumentParser(
+        description="Validate the sample space stations.")
+    parser.add_argument("--format", choices=MODES, default="text",
+                        help="report layout (default: text)")
+    args = parser.parse_args()
+    if args.format == "text":
+        print("\nSpace Station Data Validation")
+        print("========================================", flush=True)
     stations: list = [
         {
             "station_id": 15,
@@ -148,49 +247,10 @@ def main() -> None:
         }
     ]
 
-    for station in stations:
-        try:
-            model: StationModel = StationModel(**station)
-            status: str = "Operational" if model.is_operational else\
-                          "Non-operational"
-            print()
-            print("Valid station created:")
-            print("ID:", model.station_id)
-            print("Name:", model.name)
-            print(f"Crew: {model.crew_size} people")
-            print(f"Power: {model.power_level}%")
-            print(f"Oxygen: {model.oxygen_level}%")
-            print("Status:", status)
-            print()
-        except ValidationError as e:
-            print("\nExpected validation error:")
-            for error in e.errors():
-                error_name = error["loc"][0]
-                print(f"{error_name}: {error['msg']}")
-            print()
-            print("="*60)
-
-    for station in space_stations:
-        try:
-            model = StationModel(**station)
-            status = "Operational" if model.is_operational else\
-                     "Non-operational"
-            print()
-            print("Valid station created:")
-            print("ID:", model.station_id)
-            print("Name:", model.name)
-            print(f"Crew: {model.crew_size} people")
-            print(f"Power: {model.power_level}%")
-            print(f"Oxygen: {model.oxygen_level}%")
-            print("Status:", status)
-            print()
-        except ValidationError as e:
-            print("\nExpected validation error:")
-            for error in e.errors():
-                error_name = error["loc"][0]
-                print(f"{error_name}: {error['msg']}")
-            print()
-            print("="*60)
+    with ReportWriter(StationModel, station_text, station_error_text,
+                      args.format) as report:
+        report_stations(stations, report)
+        report_stations(space_stations, report, len(stations))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+from typing import Any, NamedTuple
+from pydantic_core import ErrorDetails
+from space_station import StationModel, validate_stations
+
+
+class ChangeSet(NamedTuple):
+    added: list[StationModel]
+    changed: list[StationModel]
+    # Last accepted model of each station missing from the cycle
+    removed: list[StationModel]
+    # Errors of each rejected record, keyed by its index in the cycle
+    rejected: dict[int, list[ErrorDetails]]
+    # Records equal to their station's fingerprint, skipped
+    unchanged: int
+
+
+class DeltaIngestor:
+    """Validates a telemetry cycle against the previous one.
+
+    The last accepted raw record of every station_id is kept as its
+    fingerprint: a record equal to it (a C-level dict comparison) is
+    skipped without validation. Only new and modified records go through
+    validate_stations(), in one batch, so a cycle costs one lookup per
+    station plus validation of what changed. A station missing from a
+    cycle is removed; one whose new record is rejected keeps its last
+    accepted state. Within a cycle, the last record of a station_id wins.
+    A record without a str station_id is always validated (and rejected).
+    """
+
+    def __init__(self) -> None:
+        self.stations: dict[Any, StationModel] = {}
+        # station_id -> [last accepted record, last cycle it was sent in]
+        self.fingerprints: dict[Any, list] = {}
+        self.cycles: int = 0
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    def cycle(self, records: list[dict]) -> ChangeSet:
+        self.cycles += 1
+        cycle: int = self.cycles
+        get = self.fingerprints.get
+        pending: dict[Any, int] = {}
+        # Records that can't have a fingerprint, always validated
+        unkeyed: list[int] = []
+        matched: int = 0
+        # Known stations sent in this cycle, counted once each: if all of
+        # them were, nothing was removed and the fleet isn't walked
+        known: int = 0
+        for index, record in enumerate(records):
+            station_id: Any = record.get("station_id")
+            if type(station_id) is not str:
+                # Missing, None or anything validation will reject: such
+                # records must not share a key and hide each other
+                unkeyed.append(index)
+                continue
+            entry: list | None = get(station_id)
+            if entry is None:
+                pending[station_id] = index
+                continue
+            if entry[1] != cycle:
+                entry[1] = cycle
+                known += 1
+            if entry[0] != record:
+                pending[station_id] = index
+            else:
+                matched += 1
+                if station_id in pending:
+                    del pending[station_id]
+        indexes: list[int] = sorted([*pending.values(), *unkeyed])
+        valid, errors = validate_stations([records[index]
+                                           for index in indexes])
+        added: list[StationModel] = []
+        changed: list[StationModel] = []
+        models = iter(valid)
+        for position, index in enumerate(indexes):
+            if position in errors:
+                continue
+            model: StationModel = next(models)
+            station_id = records[index]["station_id"]
+            previous: StationModel | None = self.stations.get(station_id)
+            # The new record may only differ in how it spells the same
+            # values ("98" for 98.0). Field dicts compared in C, not
+            # through BaseModel.__eq__
+            if previous is None:
+                added.append(model)
+            elif previous.__dict__ != model.__dict__:
+                changed.append(model)
+            self.stations[station_id] = model
+            self.fingerprints[station_id] = [dict(records[index]), cycle]
+        removed: list[StationModel] = []
+        if known < len(self.stations) - len(added):
+            for station_id in [station_id for station_id, entry
+                               in self.fingerprints.items()
+                               if entry[1] != cycle]:
+                removed.append(self.stations.pop(station_id))
+                del self.fingerprints[station_id]
+        return ChangeSet(added, changed, removed,
+                         {indexes[position]: error
+                          for position, error in errors.items()},
+                         matched)
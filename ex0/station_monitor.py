@@ -0,0 +1,226 @@
+from collections import deque
+from typing import Iterable, NamedTuple
+from space_station import StationModel
+
+
+WINDOW: int = 60
+# Running sums are rebuilt from the samples after this many evictions, so
+# float rounding can't pile up; it keeps the cost amortized O(1)
+REFRESH: int = 1024
+# Fewer samples than that make a trend out of noise
+MIN_TREND_SAMPLES: int = 10
+
+
+class Thresholds(NamedTuple):
+    # An alert fires when a value goes below its minimum, or the trend
+    # (per update, or per second with a time window) below its slope
+    oxygen_min: float = 85.0
+    power_min: float = 70.0
+    oxygen_slope: float = -0.5
+    power_slope: float = -1.0
+    down_cycles: int = 3
+
+
+class Alert(NamedTuple):
+    station_id: str
+    kind: str
+    value: float
+
+
+class MetricStats(NamedTuple):
+    low: float
+    mean: float
+    high: float
+    slope: float
+
+
+class MetricWindow:
+    """Rolling min, mean, max and least-squares trend of one metric.
+
+    Samples are (x, value), x being an update number or a time. The mean
+    and trend come from running sums, min and max from monotonic deques,
+    so add() is amortized O(1) whatever the window. `size` bounds the
+    number of samples, `span` their age in x units; either can be None.
+    """
+
+    __slots__ = ("size", "span", "samples", "lows", "highs", "origin",
+                 "sum_x", "sum_y", "sum_xy", "sum_xx", "evicted")
+
+    def __init__(self, size: int | None = WINDOW,
+                 span: float | None = None) -> None:
+        self.size = size
+        self.span = span
+        self.samples: deque[tuple[float, float]] = deque()
+        self.lows: deque[tuple[float, float]] = deque()
+        self.highs: deque[tuple[float, float]] = deque()
+        # x is summed relative to origin to keep the sums small
+        self.origin: float = 0.0
+        self.sum_x: float = 0.0
+        self.sum_y: float = 0.0
+        self.sum_xy: float = 0.0
+        self.sum_xx: float = 0.0
+        self.evicted: int = 0
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def add(self, x: float, value: float) -> None:
+        samples: deque[tuple[float, float]] = self.samples
+        if not samples:
+            self.origin = x
+        sample: tuple[float, float] = (x, value)
+        samples.append(sample)
+        dx: float = x - self.origin
+        self.sum_x += dx
+        self.sum_y += value
+        self.sum_xy += dx * value
+        self.sum_xx += dx * dx
+        lows: deque[tuple[float, float]] = self.lows
+        while lows and lows[-1][1] >= value:
+            lows.pop()
+        lows.append(sample)
+        highs: deque[tuple[float, float]] = self.highs
+        while highs and highs[-1][1] <= value:
+            highs.pop()
+        highs.append(sample)
+        if self.size is not None and len(samples) > self.size:
+            self._evict()
+        if self.span is not None:
+            while samples[0][0] < x - self.span:
+                self._evict()
+
+    def _evict(self) -> None:
+        sample: tuple[float, float] = self.samples.popleft()
+        x, value = sample
+        dx: float = x - self.origin
+        self.sum_x -= dx
+        self.sum_y -= value
+        self.sum_xy -= dx * value
+        self.sum_xx -= dx * dx
+        if self.lows[0] is sample:
+            self.lows.popleft()
+        if self.highs[0] is sample:
+            self.highs.popleft()
+        self.evicted += 1
+        if self.evicted >= REFRESH:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        # Rebased on the oldest sample and summed again from scratch
+        self.evicted = 0
+        self.origin = self.samples[0][0]
+        self.sum_x = self.sum_y = self.sum_xy = self.sum_xx = 0.0
+        for x, value in self.samples:
+            dx: float = x - self.origin
+            self.sum_x += dx
+            self.sum_y += value
+            self.sum_xy += dx * value
+            self.sum_xx += dx * dx
+
+    def slope(self) -> float:
+        count: int = len(self.samples)
+        if count < MIN_TREND_SAMPLES:
+            return 0.0
+        spread: float = count * self.sum_xx - self.sum_x * self.sum_x
+        if spread <= 0:
+            return 0.0
+        return (count * self.sum_xy - self.sum_x * self.sum_y) / spread
+
+    def stats(self) -> MetricStats:
+        return MetricStats(self.lows[0][1], self.sum_y / len(self.samples),
+                           self.highs[0][1], self.slope())
+
+
+# Alert kinds as bits, so a station's raised alerts are one int
+ALERTS: tuple[str, ...] = ("oxygen_low", "power_low", "down",
+                           "oxygen_falling", "power_falling")
+OXYGEN_LOW, POWER_LOW, DOWN, OXYGEN_FALLING, POWER_FALLING = (
+    1 << bit for bit in range(len(ALERTS)))
+
+
+class StationHealth:
+    __slots__ = ("oxygen", "power", "updates", "down", "alerts")
+
+    def __init__(self, size: int | None, span: float | None) -> None:
+        self.oxygen: MetricWindow = MetricWindow(size, span)
+        self.power: MetricWindow = MetricWindow(size, span)
+        self.updates: int = 0
+        # Consecutive non-operational updates
+        self.down: int = 0
+        # Bits of the alerts currently raised
+        self.alerts: int = 0
+
+
+class HealthMonitor:
+    """Streaming oxygen and power health of every station.
+
+    Each update costs amortized O(1). Alerts fire once, when their
+    condition starts to hold, and can fire again after it cleared:
+        oxygen_low / power_low          value below the minimum
+        oxygen_falling / power_falling  trend below the slope
+        down                            non-operational for down_cycles
+                                        updates in a row
+    The window holds the last `window` updates, and with `span` only
+    those of the last `span` seconds (pass `at` to update(), and window=None
+    for a purely time-based one). Trends are per update, or per second when
+    `at` is given.
+    """
+
+    def __init__(self, window: int | None = WINDOW,
+                 span: float | None = None,
+                 thresholds: Thresholds = Thresholds()) -> None:
+        self.window = window
+        self.span = span
+        self.thresholds = thresholds
+        self.stations: dict[str, StationHealth] = {}
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    def update(self, station: StationModel, at: float | None = None
+               ) -> list[Alert]:
+        health: StationHealth | None = self.stations.get(station.station_id)
+        if health is None:
+            health = self.stations[station.station_id] = StationHealth(
+                self.window, self.span)
+        health.updates += 1
+        x: float = health.updates if at is None else at
+        oxygen: float = station.oxygen_level
+        power: float = station.power_level
+        health.oxygen.add(x, oxygen)
+        health.power.add(x, power)
+        health.down = 0 if station.is_operational else health.down + 1
+        limits: Thresholds = self.thresholds
+        flags: int = 0
+        if oxygen < limits.oxygen_min:
+            flags |= OXYGEN_LOW
+        if power < limits.power_min:
+            flags |= POWER_LOW
+        if health.down >= limits.down_cycles:
+            flags |= DOWN
+        oxygen_slope: float = health.oxygen.slope()
+        if oxygen_slope < limits.oxygen_slope:
+            flags |= OXYGEN_FALLING
+        power_slope: float = health.power.slope()
+        if power_slope < limits.power_slope:
+            flags |= POWER_FALLING
+        raised: int = flags & ~health.alerts
+        health.alerts = flags
+        if not raised:
+            return []
+        values: tuple[float, ...] = (oxygen, power, health.down,
+                                     oxygen_slope, power_slope)
+        return [Alert(station.station_id, kind, values[bit])
+                for bit, kind in enumerate(ALERTS) if raised >> bit & 1]
+
+    def cycle(self, stations: Iterable[StationModel],
+              at: float | None = None) -> list[Alert]:
+        alerts: list[Alert] = []
+        for station in stations:
+            alerts += self.update(station, at)
+        return alerts
+
+    def stats(self, station_id: str) -> dict[str, MetricStats]:
+        health: StationHealth = self.stations[station_id]
+        return {"oxygen_level": health.oxygen.stats(),
+                "power_level": health.power.stats()}
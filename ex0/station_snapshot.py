@@ -0,0 +1,60 @@
+from datetime import date
+# space_station puts the repository root on sys.path for shared/
+from space_station import StationModel
+from shared.snapshot import (
+    BOOL,
+    STRING,
+    Column,
+    read_snapshot,
+    trusted_factory,
+    write_snapshot)
+
+
+KIND: int = 1
+# Floats stay float64 so a reloaded fleet is equal to the saved one
+STATION_COLUMNS: list[Column] = [
+    Column("station_id", STRING),
+    Column("name", STRING),
+    Column("crew_size", "b"),
+    Column("power_level", "d"),
+    Column("oxygen_level", "d"),
+    Column("last_maintenance", "i"),
+    Column("is_operational", BOOL),
+    Column("notes", STRING),
+]
+
+
+def save_stations(path: str, stations: list[StationModel]) -> None:
+    write_snapshot(path, KIND, [(STATION_COLUMNS, {
+        "station_id": [s.station_id for s in stations],
+        "name": [s.name for s in stations],
+        "crew_size": [s.crew_size for s in stations],
+        "power_level": [s.power_level for s in stations],
+        "oxygen_level": [s.oxygen_level for s in stations],
+        "last_maintenance": [s.last_maintenance.toordinal()
+                             for s in stations],
+        "is_operational": [s.is_operational for s in stations],
+        "notes": [s.notes for s in stations],
+    })])
+
+
+def load_stations(path: str) -> list[StationModel]:
+    """Reload stations saved by save_stations() without validating them.
+
+    Only trust snapshots this program wrote: the checksum catches a
+    damaged file, not a forged one.
+    """
+    columns: dict[str, list] = read_snapshot(path, KIND,
+                                             [STATION_COLUMNS])[0]
+    build = trusted_factory(StationModel)
+    # A fleet shares few maintenance days: one date object per day
+    days: dict[int, date] = {day: date.fromordinal(day)
+                             for day in set(columns["last_maintenance"])}
+    return [build({"station_id": station_id, "name": name,
+                   "crew_size": crew_size, "power_level": power_level,
+                   "oxygen_level": oxygen_level,
+                   "last_maintenance": days[last_maintenance],
+                   "is_operational": is_operational, "notes": notes})
+            for (station_id, name, crew_size, power_level, oxygen_level,
+                 last_maintenance, is_operational, notes)
+            in zip(*(columns[column.name] for column in STATION_COLUMNS))]
@@ -0,0 +1,101 @@
+from datetime import date
+import numpy as np
+from space_station import StationModel
+
+
+NUMERIC_COLUMNS: tuple[str, ...] = ("crew_size", "power_level",
+                                    "oxygen_level", "last_maintenance")
+
+
+class StationStore:
+    """Validated stations packed column by column into typed arrays.
+
+    power and oxygen are float32, crew_size int8, is_operational a bool
+    mask and last_maintenance a day number (date.toordinal()). Queries are
+    numpy expressions over those columns, e.g.
+        store.select(store.is_operational & (store.oxygen_level < 90))
+    and rows only become StationModel again through to_models().
+    """
+
+    def __init__(self, station_id: np.ndarray, name: np.ndarray,
+                 crew_size: np.ndarray, power_level: np.ndarray,
+                 oxygen_level: np.ndarray, last_maintenance: np.ndarray,
+                 is_operational: np.ndarray, notes: np.ndarray) -> None:
+        self.station_id = station_id
+        self.name = name
+        self.crew_size = crew_size
+        self.power_level = power_level
+        self.oxygen_level = oxygen_level
+        self.last_maintenance = last_maintenance
+        self.is_operational = is_operational
+        self.notes = notes
+
+    @classmethod
+    def from_models(cls, stations: list[StationModel]) -> "StationStore":
+        count: int = len(stations)
+        return cls(
+            np.fromiter((s.station_id for s in stations), object, count),
+            np.fromiter((s.name for s in stations), object, count),
+            np.fromiter((s.crew_size for s in stations), np.int8, count),
+            np.fromiter((s.power_level for s in stations), np.float32,
+                        count),
+            np.fromiter((s.oxygen_level for s in stations), np.float32,
+                        count),
+            np.fromiter((s.last_maintenance.toordinal() for s in stations),
+                        np.int32, count),
+            np.fromiter((s.is_operational for s in stations), np.bool_,
+                        count),
+            np.fromiter((s.notes for s in stations), object, count),
+        )
+
+    def __len__(self) -> int:
+        return len(self.station_id)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return dict(vars(self))
+
+    def select(self, rows: np.ndarray) -> "StationStore":
+        # rows is a boolean mask or an array of indices
+        return StationStore(**{name: column[rows]
+                               for name, column in vars(self).items()})
+
+    def sort(self, by: str, descending: bool = False) -> "StationStore":
+        order: np.ndarray = np.argsort(getattr(self, by), kind="stable")
+        return self.select(order[::-1] if descending else order)
+
+    def aggregate(self) -> dict[str, dict[str, float]]:
+        summary: dict[str, dict[str, float]] = {
+            "stations": {"count": len(self),
+                         "operational": int(self.is_operational.sum())}}
+        if not len(self):
+            return summary
+        for name in NUMERIC_COLUMNS:
+            column: np.ndarray = getattr(self, name)
+            summary[name] = {"min": column.min().item(),
+                             "max": column.max().item(),
+                             "mean": column.mean(dtype=np.float64).item()}
+        return summary
+
+    def to_models(self, rows: np.ndarray | None = None
+                  ) -> list[StationModel]:
+        store: StationStore = self if rows is None else self.select(rows)
+        # str() of a float32 is its shortest repr, so 76.4 comes back as
+        # 76.4 and not 76.40000152587891
+        power: list[str] = store.power_level.astype(str).tolist()
+        oxygen: list[str] = store.oxygen_level.astype(str).tolist()
+        # The rows were validated on the way in, no need to do it again
+        return [StationModel.model_construct(
+                    station_id=station_id,
+                    name=name,
+                    crew_size=crew_size,
+                    power_level=float(power_level),
+                    oxygen_level=float(oxygen_level),
+                    last_maintenance=date.fromordinal(last_maintenance),
+                    is_operational=is_operational,
+                    notes=notes)
+                for station_id, name, crew_size, power_level, oxygen_level,
+                last_maintenance, is_operational, notes in zip(
+                    store.station_id.tolist(), store.name.tolist(),
+                    store.crew_size.tolist(), power, oxygen,
+                    store.last_maintenance.tolist(),
+                    store.is_operational.tolist(), store.notes.tolist())]
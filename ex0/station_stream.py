@@ -0,0 +1,80 @@
+import sys
+import resource
+from time import perf_counter
+from typing import BinaryIO, Iterator
+from pydantic import ValidationError
+from pydantic_core import ErrorDetails
+from space_station import StationModel
+
+
+CHUNK_SIZE: int = 1 << 20
+
+StreamResult = tuple[int, StationModel | None, list[ErrorDetails]]
+
+
+def iter_lines(stream: BinaryIO, chunk_size: int = CHUNK_SIZE
+               ) -> Iterator[bytes]:
+    # Only one chunk and one partial line are ever held in memory
+    tail: bytes = b""
+    while chunk := stream.read(chunk_size):
+        lines: list[bytes] = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def iter_stations(stream: BinaryIO, chunk_size: int = CHUNK_SIZE
+                  ) -> Iterator[StreamResult]:
+    """Lazily validate a newline-delimited JSON feed of stations.
+
+    Each line is parsed by pydantic-core straight from bytes into a
+    StationModel. Yields (line number, model, []) for a valid record and
+    (line number, None, errors) for a rejected one; blank lines are skipped.
+    """
+    validate = StationModel.model_validate_json
+    for number, line in enumerate(iter_lines(stream, chunk_size), 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, validate(line), []
+        except ValidationError as e:
+            yield number, None, e.errors(include_url=False)
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20 if sys.platform == "darwin" else 1 << 10)
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <stations.ndjson>")
+        sys.exit(1)
+    valid: int = 0
+    rejected: int = 0
+    start: float = perf_counter()
+    with open(sys.argv[1], "rb") as stream:
+        for number, model, errors in iter_stations(stream):
+            if model is not None:
+                valid += 1
+                continue
+            rejected += 1
+            print(f"Line {number}: " + ", ".join(
+                f"{error['loc'][0] if error['loc'] else 'line'}:"
+                f" {error['msg']}" for error in errors))
+    elapsed: float = perf_counter() - start
+    total: int = valid + rejected
+    print("="*60)
+    print(f"Records: {total} ({valid} valid, {rejected} rejected)")
+    print(f"Time: {elapsed:.2f}s")
+    print(f"Throughput: {total / elapsed if elapsed else 0:.0f} records/s")
+    print(f"Peak RSS: {peak_rss_mb():.1f} MB")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(e)
@@ -12,10 +12,20 @@
 
 try:
     import sys
+    from pathlib import Path
     from datetime import datetime
     from typing_extensions import Self
     from enum import Enum
-    from pydantic import BaseModel, Field, ValidationError, model_validator
+    from pydantic import (
+        BaseModel,
+        ConfigDict,
+        Field,
+        ValidationError,
+        model_validator)
+    from pydantic_core import ErrorDetails, PydanticCustomError
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from shared.profiling import profiled
+    from shared.report import MODES, ReportWriter, error_lines
 except (ImportError, ModuleNotFoundError):
     print("Pydantic librairy is missing.\nMake sure you are in a virtual"
           " environment, then download it by typing the command:")
@@ -30,7 +40,27 @@ class ContactType(Enum):
     TELEPATHIC = "telepathic"
 
 
+# Error type -> message of each check_values rule, in the order they are
+# checked. Each rule has its own error type so failures can be told apart
+# without reading the message; the messages read as the ValueErrors these
+# used to be.
+CONTACT_RULES: dict[str, str] = {
+    "contact_id_prefix": "Value error, {contact_id} isn't a valid id.",
+    "unverified_physical": "Value error, physical contact must be verified",
+    "telepathic_witnesses": "Value error, Telepathic contact requires at"
+                            " least 3 witnesses",
+    "silent_strong_signal": "Value error, Strong signals (> 7.0) should"
+                            " include received messages",
+}
+
+
+def contact_rule_error(rule: str, **context: str) -> PydanticCustomError:
+    return PydanticCustomError(rule, CONTACT_RULES[rule], context or None)
+
+
 class AlienContact(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     contact_id: str = Field(min_length=5, max_length=15)
     timestamp: datetime
     location: str = Field(min_length=3, max_length=100)
@@ -42,25 +72,49 @@ class AlienContact(BaseModel):
     is_verified: bool = False
 
     @model_validator(mode="after")
+    @profiled
     def check_values(self) -> Self:
         if not self.contact_id.startswith("AC"):
-            raise ValueError(f"{self.contact_id} isn't a valid id.")
+            raise contact_rule_error("contact_id_prefix",
+                                     contact_id=self.contact_id)
         if self.contact_type == ContactType.PHYSICAL and not self.is_verified:
-            raise ValueError(f"{self.contact_type.value} contact must be"
-                             " verified")
+            raise contact_rule_error("unverified_physical")
         if self.contact_type == ContactType.TELEPATHIC and\
                 self.witness_count < 3:
-            raise ValueError("Telepathic contact requires at least 3"
-                             " witnesses")
+            raise contact_rule_error("telepathic_witnesses")
         if self.signal_strength > 7.0 and not self.message_received:
-            raise ValueError("Strong signals (> 7.0) should include received"
-                             " messages")
+            raise contact_rule_error("silent_strong_signal")
         return self
 
 
+def contact_text(model: AlienContact) -> str:
+    return ("\nValid contact report:\n"
+            f"ID: {model.contact_id}\n"
+            f"Type: {model.contact_type.value}\n"
+            f"Location: {model.location}\n"
+            f"Signal: {model.signal_strength}/10\n"
+            f"Duration: {model.duration_minutes} minutes\n"
+            f"Witnesses: {model.witness_count}\n"
+            f"Message: {model.message_received}\n"
+            f"\n{'='*60}\n")
+
+
+def contact_error_text(name: str, errors: list[ErrorDetails]) -> str:
+    # When the raised error come from model_validator there isn't
+    # error["loc"], error_lines() only shows the message then
+    return f"Expected validation error:\n{error_lines(errors)}{'='*60}\n"
+
+
 def main():
-    print("\nAlien Contact Log Validation")
-    print("======================================")
+    from argparse import ArgumentParser
+    parser: ArgumentParser = ArgumentParser(
+        description="Validate the sample alien contact reports.")
+    parser.add_argument("--format", choices=MODES, default="text",
+                        help="report layout (default: text)")
+    args = parser.parse_args()
+    if args.format == "text":
+        print("\nAlien Contact Log Validation")
+        print("======================================", flush=True)
     contact_reports: list = [
 
         # A valid contact
@@ -104,28 +158,15 @@ def main():
             "is_verified": False,
         }
     ]
-    for contact in contact_reports:
-        try:
-            model = AlienContact(**contact)
-            print("\nValid contact report:")
-            print(f"ID: {model.contact_id}")
-            print(f"Type: {model.contact_type.value}")
-            print(f"Location: {model.location}")
-            print(f"Signal: {model.signal_strength}/10")
-            print(f"Duration: {model.duration_minutes} minutes")
-            print(f"Witnesses: {model.witness_count}")
-            print(f"Message: {model.message_received}")
-            print()
-            print("="*60)
-        except (ValidationError, Exception) as e:
-            print("Expected validation error:")
-            for error in e.errors():
-
-                # When the raised error come from model_validator there isn't
-                # error["loc"] so I have to do like this
-                loc: str = "" if not error["loc"] else f"{error['loc'][0]}: "
-                print(f"{loc}{error['msg']}")
-            print("="*60)
+    with ReportWriter(AlienContact, contact_text, contact_error_text,
+                      args.format) as report:
+        for index, contact in enumerate(contact_reports):
+            try:
+                report.accepted(index, AlienContact(**contact))
+            except ValidationError as e:
+                report.rejected(index, e.errors(include_url=False,
+                                                **report.error_options),
+                                record=contact)
 
 
 if __name__ == "__main__":
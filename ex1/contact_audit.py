@@ -0,0 +1,134 @@
+from typing import NamedTuple
+import numpy as np
+from alien_contact import (CONTACT_RULES, AlienContact, ContactType,
+                           contact_rule_error)
+
+
+# Bit of each check_values rule in a violation code, in CONTACT_RULES order:
+# the lowest bit set is the rule check_values would raise
+RULES: tuple[str, ...] = tuple(CONTACT_RULES)
+RULE_BITS: dict[str, int] = {rule: 1 << bit for bit, rule in
+                             enumerate(RULES)}
+# contact_type as int8: its index in ContactType, -1 if unknown
+TYPES: list[ContactType] = list(ContactType)
+TYPE_CODES: dict[ContactType | str, int] = {
+    **{member: code for code, member in enumerate(TYPES)},
+    **{member.value: code for code, member in enumerate(TYPES)}}
+PHYSICAL: int = TYPE_CODES[ContactType.PHYSICAL]
+TELEPATHIC: int = TYPE_CODES[ContactType.TELEPATHIC]
+
+
+class AuditRules(NamedTuple):
+    # The limits check_values applies, so an archive can be audited again
+    # against changed ones
+    id_prefix: str = "AC"
+    telepathic_witnesses: int = 3
+    strong_signal: float = 7.0
+
+
+class ContactBatch:
+    """The columns of a batch of contacts the check_values rules read.
+
+    Built from AlienContact models or from raw records, like an archive
+    of reports accepted once: their fields are expected to be valid already
+    (missing is_verified and message_received take their defaults). The
+    rules then run as numpy masks over whole columns, without building a
+    single model.
+    """
+
+    def __init__(self, contact_id: np.ndarray, contact_type: np.ndarray,
+                 witness_count: np.ndarray, signal_strength: np.ndarray,
+                 has_message: np.ndarray, is_verified: np.ndarray) -> None:
+        self.contact_id = contact_id
+        self.contact_type = contact_type
+        self.witness_count = witness_count
+        self.signal_strength = signal_strength
+        self.has_message = has_message
+        self.is_verified = is_verified
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "ContactBatch":
+        count: int = len(records)
+        return cls(
+            np.array([r.get("contact_id") for r in records], str),
+            np.fromiter((TYPE_CODES.get(r.get("contact_type"), -1)
+                         for r in records), np.int8, count),
+            np.fromiter((r.get("witness_count") for r in records), np.int64,
+                        count),
+            np.fromiter((r.get("signal_strength") for r in records),
+                        np.float64, count),
+            np.fromiter((bool(r.get("message_received")) for r in records),
+                        np.bool_, count),
+            np.fromiter((r.get("is_verified", False) for r in records),
+                        np.bool_, count),
+        )
+
+    @classmethod
+    def from_models(cls, contacts: list[AlienContact]) -> "ContactBatch":
+        count: int = len(contacts)
+        return cls(
+            np.array([c.contact_id for c in contacts], str),
+            np.fromiter((TYPE_CODES[c.contact_type] for c in contacts),
+                        np.int8, count),
+            np.fromiter((c.witness_count for c in contacts), np.int64,
+                        count),
+            np.fromiter((c.signal_strength for c in contacts), np.float64,
+                        count),
+            np.fromiter((bool(c.message_received) for c in contacts),
+                        np.bool_, count),
+            np.fromiter((c.is_verified for c in contacts), np.bool_, count),
+        )
+
+    def __len__(self) -> int:
+        return len(self.contact_id)
+
+
+def rule_masks(batch: ContactBatch, limits: AuditRules = AuditRules()
+               ) -> dict[str, np.ndarray]:
+    # Rows breaking each rule, checked independently of each other, in
+    # RULES order
+    masks: dict[str, np.ndarray] = {
+        "contact_id_prefix": ~np.char.startswith(batch.contact_id,
+                                                 limits.id_prefix),
+        "unverified_physical": ((batch.contact_type == PHYSICAL)
+                                & ~batch.is_verified),
+        "telepathic_witnesses": ((batch.contact_type == TELEPATHIC)
+                                 & (batch.witness_count
+                                    < limits.telepathic_witnesses)),
+        "silent_strong_signal": ((batch.signal_strength
+                                  > limits.strong_signal)
+                                 & ~batch.has_message),
+    }
+    return {rule: masks[rule] for rule in RULES}
+
+
+def violation_codes(batch: ContactBatch, limits: AuditRules = AuditRules()
+                    ) -> np.ndarray:
+    """Every rule each row breaks, as RULE_BITS or-ed in a uint8.
+
+    0 means the row passes check_values. Unlike check_values, a row
+    breaking several rules has all of them set.
+    """
+    codes: np.ndarray = np.zeros(len(batch), np.uint8)
+    for rule, mask in rule_masks(batch, limits).items():
+        # A bool mask is already 0 and 1 bytes
+        codes |= mask.view(np.uint8) << RULE_BITS[rule].bit_length() - 1
+    return codes
+
+
+def first_violations(codes: np.ndarray) -> np.ndarray:
+    # Index in RULES of the rule check_values raises for each row, -1 for
+    # the rows that pass
+    first: np.ndarray = np.full(len(codes), -1, np.int8)
+    for bit in reversed(range(len(RULES))):
+        first[(codes >> bit & 1).astype(bool)] = bit
+    return first
+
+
+def violation_messages(batch: ContactBatch, codes: np.ndarray, row: int
+                       ) -> dict[str, str]:
+    # Error type -> message of each rule one row breaks, as check_values
+    # words them
+    contact_id: str = str(batch.contact_id[row])
+    return {rule: contact_rule_error(rule, contact_id=contact_id).message()
+            for rule in RULES if codes[row] & RULE_BITS[rule]}
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from contact_pool import ContactResult, validate_contact
+
+
+MAX_SIZE: int = 65_536
+
+
+def report_key(report: dict) -> tuple:
+    # Built with C-level calls only, it has to stay much cheaper than a
+    # validation. Field order is part of the key: a reordered copy is only a
+    # miss. So are the types: 1, 1.0 and True are equal (and hash the same)
+    # in Python but don't validate the same way.
+    values: tuple = tuple(report.values())
+    return tuple(report), values, tuple(map(type, values))
+
+
+class ContactCache:
+    """Opt-in LRU cache of AlienContact validation results.
+
+    Reports are keyed on their content, so a retransmitted copy gets the
+    model (or the error list) of the first one without running field
+    validation or check_values again. The cached model is shared between
+    hits, don't mutate it.
+    """
+
+    def __init__(self, maxsize: int = MAX_SIZE) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        # The first key is the least recently used one, a hit is moved back
+        # to the end. Not a plain dict: deleting from its front leaves
+        # dead slots that every next(iter()) has to walk past
+        self.results: OrderedDict[tuple, ContactResult] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.uncached: int = 0
+
+    def validate(self, report: dict) -> ContactResult:
+        key: tuple = report_key(report)
+        results: OrderedDict[tuple, ContactResult] = self.results
+        try:
+            result: ContactResult | None = results.get(key)
+        except TypeError:
+            # An unhashable value (a list, a dict...) can't be a key, such a
+            # report is validated every time
+            self.uncached += 1
+            return validate_contact(report)
+        if result is None:
+            self.misses += 1
+            result = validate_contact(report)
+            if len(results) >= self.maxsize:
+                results.popitem(last=False)
+                self.evictions += 1
+            results[key] = result
+        else:
+            self.hits += 1
+            results.move_to_end(key)
+        return result
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "uncached": self.uncached,
+                "size": len(self.results), "maxsize": self.maxsize}
+
+    def clear(self) -> None:
+        self.results.clear()
+        self.hits = self.misses = self.evictions = self.uncached = 0
@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, NamedTuple
+from alien_contact import AlienContact, ContactType
+
+
+TOLERANCE: timedelta = timedelta(minutes=30)
+NAIVE_EPOCH: datetime = datetime(1970, 1, 1)
+AWARE_EPOCH: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class ContactEvent(NamedTuple):
+    location: str
+    contact_type: ContactType
+    start: datetime
+    end: datetime
+    reports: int
+    witnesses: int
+    max_signal: float
+    contact_ids: list[str]
+
+
+def seconds(timestamp: datetime) -> float:
+    # Not timestamp(): a naive datetime would go through the local timezone
+    # and its DST jumps
+    epoch: datetime = NAIVE_EPOCH if timestamp.tzinfo is None\
+        else AWARE_EPOCH
+    return (timestamp - epoch).total_seconds()
+
+
+class EventClusterer:
+    """Merges reports of the same event, in near-linear time.
+
+    Two contacts with the same location and contact type and timestamps at
+    most `tolerance` apart belong to the same event, and so does anything
+    chained to them that way. Contacts go into buckets of (location,
+    contact type, timestamp // tolerance): everything in a bucket is
+    within tolerance of each other, so a bucket is one union-find node,
+    and a new contact only has to be checked against the two neighbouring
+    buckets. Each add() is amortized O(1), in any order. Timestamps must
+    all be naive or all timezone-aware, as pydantic parsed them: add()
+    rejects a contact that doesn't match the first one.
+    """
+
+    def __init__(self, tolerance: timedelta = TOLERANCE) -> None:
+        self.tolerance: float = tolerance.total_seconds()
+        # Whether the timestamps are timezone-aware, set by the first add()
+        self.aware: bool | None = None
+        # (location, contact type) -> {timestamp // tolerance: node}
+        self.buckets: dict[tuple[str, ContactType], dict[int, int]] = {}
+        # Per node: its union-find parent and the time range of its bucket
+        self.parent: list[int] = []
+        self.low: list[float] = []
+        self.high: list[float] = []
+        # Per root: the event so far
+        self.first: list[datetime] = []
+        self.last: list[datetime] = []
+        self.reports: list[int] = []
+        self.witnesses: list[int] = []
+        self.strongest: list[float] = []
+        self.contact_ids: list[list[str]] = []
+
+    def find(self, node: int) -> int:
+        parent: list[int] = self.parent
+        while parent[node] != node:
+            # Path halving
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, left: int, right: int) -> None:
+        left, right = self.find(left), self.find(right)
+        if left == right:
+            return
+        # The root keeping the longer id list absorbs the other one
+        if len(self.contact_ids[left]) < len(self.contact_ids[right]):
+            left, right = right, left
+        self.parent[right] = left
+        self.first[left] = min(self.first[left], self.first[right])
+        self.last[left] = max(self.last[left], self.last[right])
+        self.reports[left] += self.reports[right]
+        self.witnesses[left] += self.witnesses[right]
+        self.strongest[left] = max(self.strongest[left],
+                                   self.strongest[right])
+        self.contact_ids[left] += self.contact_ids[right]
+        self.contact_ids[right] = []
+
+    def add(self, contact: AlienContact) -> None:
+        aware: bool = contact.timestamp.tzinfo is not None
+        if aware is not self.aware:
+            if self.aware is not None:
+                # Checked before anything is stored: first and last could
+                # no longer be compared
+                raise ValueError(
+                    f"{contact.contact_id}: can't mix naive and"
+                    " timezone-aware timestamps.")
+            self.aware = aware
+        at: float = seconds(contact.timestamp)
+        tolerance: float = self.tolerance
+        bucket: int = int(at // tolerance)
+        # One lookup on (location, contact type), then int keys only: an
+        # Enum hashes in Python
+        key: tuple[str, ContactType] = (contact.location,
+                                        contact.contact_type)
+        buckets: dict[int, int] | None = self.buckets.get(key)
+        if buckets is None:
+            buckets = self.buckets[key] = {}
+        low: list[float] = self.low
+        high: list[float] = self.high
+        node: int | None = buckets.get(bucket)
+        if node is None:
+            node = buckets[bucket] = len(self.parent)
+            self.parent.append(node)
+            low.append(at)
+            high.append(at)
+            self.first.append(contact.timestamp)
+            self.last.append(contact.timestamp)
+            self.reports.append(1)
+            self.witnesses.append(contact.witness_count)
+            self.strongest.append(contact.signal_strength)
+            self.contact_ids.append([contact.contact_id])
+        else:
+            if at < low[node]:
+                low[node] = at
+            if at > high[node]:
+                high[node] = at
+            root: int = self.find(node)
+            if contact.timestamp < self.first[root]:
+                self.first[root] = contact.timestamp
+            if contact.timestamp > self.last[root]:
+                self.last[root] = contact.timestamp
+            self.reports[root] += 1
+            self.witnesses[root] += contact.witness_count
+            if contact.signal_strength > self.strongest[root]:
+                self.strongest[root] = contact.signal_strength
+            self.contact_ids[root].append(contact.contact_id)
+        # Only this contact can have brought the buckets close enough
+        before: int | None = buckets.get(bucket - 1)
+        if before is not None and at - high[before] <= tolerance:
+            self.union(node, before)
+        after: int | None = buckets.get(bucket + 1)
+        if after is not None and low[after] - at <= tolerance:
+            self.union(node, after)
+
+    def extend(self, contacts: Iterable[AlienContact]) -> None:
+        for contact in contacts:
+            self.add(contact)
+
+    def events(self) -> list[ContactEvent]:
+        parent: list[int] = self.parent
+        return sorted((ContactEvent(
+            location, contact_type, self.first[node], self.last[node],
+            self.reports[node], self.witnesses[node], self.strongest[node],
+            self.contact_ids[node])
+            for (location, contact_type), buckets in self.buckets.items()
+            for node in buckets.values() if parent[node] == node),
+            key=lambda event: event.start)
+
+
+def cluster_contacts(contacts: Iterable[AlienContact],
+                     tolerance: timedelta = TOLERANCE) -> list[ContactEvent]:
+    clusterer: EventClusterer = EventClusterer(tolerance)
+    clusterer.extend(contacts)
+    return clusterer.events()
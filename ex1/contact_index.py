@@ -0,0 +1,106 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from operator import attrgetter
+from alien_contact import AlienContact, ContactType
+
+
+class TimeIndex:
+    # Row numbers kept sorted by timestamp, next to the timestamps
+    # themselves so a time range is two bisects and a slice
+    __slots__ = ("times", "rows")
+
+    def __init__(self) -> None:
+        self.times: list[datetime] = []
+        self.rows: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def insert(self, time: datetime, row: int) -> None:
+        position: int = bisect_right(self.times, time)
+        self.times.insert(position, time)
+        self.rows.insert(position, row)
+
+    def append(self, time: datetime, row: int) -> None:
+        # Only for rows coming in timestamp order (bulk loading)
+        self.times.append(time)
+        self.rows.append(row)
+
+    def between(self, start: datetime | None, end: datetime | None
+                ) -> list[int]:
+        low: int = 0 if start is None else bisect_left(self.times, start)
+        high: int = len(self.times) if end is None else\
+            bisect_right(self.times, end)
+        return self.rows[low:high]
+
+
+class ContactIndex:
+    """In-memory index of validated AlienContact reports.
+
+    A sorted timestamp index over every contact, plus one per location,
+    per contact type and per (location, contact type) pair, so a query
+    only bisects the most specific index for its filters. Timestamps must
+    all be naive or all timezone-aware, as pydantic parsed them.
+
+        index.query(start, end, location="Uranus",
+                    contact_type=ContactType.RADIO, verified=True)
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.contacts: list[AlienContact] = []
+        self.by_time: TimeIndex = TimeIndex()
+        self.by_location: dict[str, TimeIndex] = {}
+        self.by_type: dict[ContactType, TimeIndex] = {}
+        self.by_location_type: dict[tuple[str, ContactType], TimeIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self.contacts)
+
+    def _indexes(self, contact: AlienContact) -> tuple[TimeIndex, ...]:
+        return (
+            self.by_time,
+            self.by_location.setdefault(contact.location, TimeIndex()),
+            self.by_type.setdefault(contact.contact_type, TimeIndex()),
+            self.by_location_type.setdefault(
+                (contact.location, contact.contact_type), TimeIndex()))
+
+    def add(self, contact: AlienContact) -> None:
+        row: int = len(self.contacts)
+        self.contacts.append(contact)
+        for index in self._indexes(contact):
+            index.insert(contact.timestamp, row)
+
+    def bulk_load(self, contacts: list[AlienContact]) -> None:
+        # One sort for the whole batch instead of an insertion per contact
+        if self.contacts:
+            contacts = self.contacts + list(contacts)
+            self.clear()
+        self.contacts = sorted(contacts, key=attrgetter("timestamp"))
+        for row, contact in enumerate(self.contacts):
+            for index in self._indexes(contact):
+                index.append(contact.timestamp, row)
+
+    def query(self, start: datetime | None = None,
+              end: datetime | None = None, location: str | None = None,
+              contact_type: ContactType | None = None,
+              verified: bool | None = None) -> list[AlienContact]:
+        """Contacts between start and end (both included), oldest first."""
+        index: TimeIndex | None
+        if location is not None and contact_type is not None:
+            index = self.by_location_type.get((location, contact_type))
+        elif location is not None:
+            index = self.by_location.get(location)
+        elif contact_type is not None:
+            index = self.by_type.get(contact_type)
+        else:
+            index = self.by_time
+        if index is None:
+            return []
+        contacts: list[AlienContact] = self.contacts
+        if verified is None:
+            return [contacts[row] for row in index.between(start, end)]
+        return [contacts[row] for row in index.between(start, end)
+                if contacts[row].is_verified is verified]
@@ -0,0 +1,45 @@
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from pydantic import ValidationError
+from pydantic_core import ErrorDetails
+from alien_contact import AlienContact
+
+
+CHUNK_SIZE: int = 5_000
+
+ContactResult = tuple[AlienContact | None, list[ErrorDetails]]
+
+
+def validate_contact(report: dict) -> ContactResult:
+    try:
+        return AlienContact(**report), []
+    except ValidationError as e:
+        return None, e.errors(include_url=False)
+
+
+def validate_contacts(reports: list) -> list[ContactResult]:
+    return [validate_contact(report) for report in reports]
+
+
+def validate_contacts_parallel(reports: list, workers: int | None = None,
+                               chunk_size: int = CHUNK_SIZE
+                               ) -> list[ContactResult]:
+    """Validate reports in a process pool, chunk by chunk.
+
+    Gives exactly what validate_contacts() gives, in the same order.
+    `workers` defaults to the number of cores; with a single worker or a
+    single chunk the pool is skipped altogether.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or cpu_count() or 1
+    chunks: list[list] = [reports[start:start + chunk_size]
+                          for start in range(0, len(reports), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        return validate_contacts(reports)
+    results: list[ContactResult] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        # map() hands the chunks back in submission order
+        for chunk_results in pool.map(validate_contacts, chunks):
+            results.extend(chunk_results)
+    return results
@@ -0,0 +1,61 @@
+from pydantic_core import ErrorDetails
+from alien_contact import ContactType, contact_rule_error
+from contact_pool import ContactResult, validate_contact
+
+
+PHYSICAL: tuple = (ContactType.PHYSICAL, "physical")
+TELEPATHIC: tuple = (ContactType.TELEPATHIC, "telepathic")
+
+
+def _rule_error(report: dict, rule: str, **context: str) -> ErrorDetails:
+    return {"type": rule, "loc": (),
+            "msg": contact_rule_error(rule, **context).message(),
+            "input": report}
+
+
+def prescreen(report: dict, fail_fast: bool = False) -> list[ErrorDetails]:
+    """Apply the check_values rules to a raw report, before any parsing.
+
+    A rule only fires when the raw values settle it: an id that is a str
+    not starting with "AC", a physical contact whose is_verified is missing
+    or False, a telepathic one with 1 or 2 witnesses as an int, a signal
+    above 7.0 with no message. Anything else (unusual types, out of range
+    values) is left to the full validation, so a report that passes
+    AlienContact is never rejected here. The errors carry the messages and
+    types check_values uses; unlike check_values, every broken rule is
+    reported unless `fail_fast` is set. Field errors the full validation
+    would also have found are not computed.
+    """
+    errors: list[ErrorDetails] = []
+    contact_id = report.get("contact_id")
+    if type(contact_id) is str and 5 <= len(contact_id) <= 15\
+            and not contact_id.startswith("AC"):
+        errors.append(_rule_error(report, "contact_id_prefix",
+                                  contact_id=contact_id))
+        if fail_fast:
+            return errors
+    contact_type = report.get("contact_type")
+    if contact_type in PHYSICAL and report.get("is_verified", False) is False:
+        errors.append(_rule_error(report, "unverified_physical"))
+        if fail_fast:
+            return errors
+    witnesses = report.get("witness_count")
+    if contact_type in TELEPATHIC and type(witnesses) is int\
+            and 1 <= witnesses < 3:
+        errors.append(_rule_error(report, "telepathic_witnesses"))
+        if fail_fast:
+            return errors
+    signal = report.get("signal_strength")
+    if type(signal) in (int, float) and 7.0 < signal <= 10\
+            and report.get("message_received", "") == "":
+        errors.append(_rule_error(report, "silent_strong_signal"))
+    return errors
+
+
+def validate_screened(report: dict, fail_fast: bool = False
+                      ) -> ContactResult:
+    # Full validation only for the reports the pre-screen lets through
+    errors: list[ErrorDetails] = prescreen(report, fail_fast)
+    if errors:
+        return None, errors
+    return validate_contact(report)
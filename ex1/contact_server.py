@@ -0,0 +1,162 @@
+import asyncio
+import json
+from pydantic import ValidationError
+# alien_contact puts the repository root on sys.path for shared/
+from alien_contact import AlienContact
+from shared.report import error_location
+
+
+BATCH_SIZE: int = 256
+QUEUE_SIZE: int = 4096
+LINE_LIMIT: int = 1 << 16
+
+Pending = tuple[bytes, asyncio.Future]
+
+# Response to a report longer than LINE_LIMIT, which is skipped unread
+OVERSIZED: bytes = json.dumps({"status": "rejected", "errors": [
+    {"loc": "", "msg": f"Report longer than {LINE_LIMIT} bytes"}]}
+    ).encode() + b"\n"
+
+
+def check_report(line: bytes) -> bytes:
+    # Straight from the JSON bytes to the model, no intermediate dict
+    try:
+        model: AlienContact = AlienContact.model_validate_json(line)
+    except ValidationError as e:
+        return json.dumps({"status": "rejected", "errors": [
+            {"loc": error_location(error), "msg": error["msg"]}
+            for error in e.errors(include_url=False)]}).encode() + b"\n"
+    return json.dumps({"status": "accepted",
+                       "contact_id": model.contact_id}).encode() + b"\n"
+
+
+class ContactServer:
+    """Validates newline-delimited JSON contact reports sent over a socket.
+
+    Every connection pushes its reports into one bounded queue that a
+    single task drains in micro-batches of up to `batch_size`. When the
+    queue is full, connections stop being read until validation catches up,
+    and TCP flow control slows the sensors down. Each report gets one
+    response line, in the order it was sent:
+        {"status": "accepted", "contact_id": "AC_001"}
+        {"status": "rejected", "errors": [{"loc": "", "msg": "..."}]}
+    """
+
+    def __init__(self, batch_size: int = BATCH_SIZE,
+                 queue_size: int = QUEUE_SIZE) -> None:
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.queue: asyncio.Queue[Pending] = asyncio.Queue(queue_size)
+        self.validated: int = 0
+
+    async def validate_batches(self) -> None:
+        while True:
+            batch: list[Pending] = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            for line, future in batch:
+                if not future.cancelled():
+                    future.set_result(check_report(line))
+                self.queue.task_done()
+            self.validated += len(batch)
+            # Let the connections read and write between two batches
+            await asyncio.sleep(0)
+
+    async def handle(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        # Bounded too: a sensor that never reads its responses ends up not
+        # being read either
+        responses: asyncio.Queue[asyncio.Future | None] = asyncio.Queue(
+            self.queue_size)
+        sender: asyncio.Task = asyncio.create_task(
+            self.send_responses(responses, writer))
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        oversized: bool = False
+        ended: bool = False
+        try:
+            while not ended:
+                try:
+                    line: bytes = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    # End of stream, maybe after a last unterminated line
+                    line, ended = e.partial, True
+                except asyncio.LimitOverrunError as e:
+                    # Drop what was read of the line so far, and the rest
+                    # of it on the next turns, up to its newline
+                    await reader.readexactly(e.consumed)
+                    oversized = True
+                    continue
+                future: asyncio.Future
+                if oversized:
+                    oversized = False
+                    future = loop.create_future()
+                    future.set_result(OVERSIZED)
+                    await responses.put(future)
+                    continue
+                if not line.strip():
+                    continue
+                future = loop.create_future()
+                await responses.put(future)
+                # Blocks while the queue is full: that's the backpressure
+                await self.queue.put((line, future))
+        except ConnectionError:
+            pass
+        finally:
+            await responses.put(None)
+            await sender
+
+    @staticmethod
+    async def send_responses(responses: asyncio.Queue,
+                             writer: asyncio.StreamWriter) -> None:
+        try:
+            while (future := await responses.get()) is not None:
+                writer.write(await future)
+                if responses.empty():
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765,
+                    unix_path: str | None = None) -> None:
+        validator: asyncio.Task = asyncio.create_task(
+            self.validate_batches())
+        if unix_path:
+            server = await asyncio.start_unix_server(
+                self.handle, unix_path, limit=LINE_LIMIT)
+        else:
+            server = await asyncio.start_server(self.handle, host, port,
+                                                limit=LINE_LIMIT)
+        where: str = unix_path or f"{host}:{port}"
+        print(f"Listening for contact reports on {where}", flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            validator.cancel()
+
+
+def main() -> None:
+    from argparse import ArgumentParser
+    parser: ArgumentParser = ArgumentParser(
+        description="Validate alien contact reports sent as newline-"
+                    "delimited JSON over TCP or a Unix socket.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH",
+                        help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE,
+                        help="reports waiting for validation before"
+                             " connections stop being read")
+    args = parser.parse_args()
+    server: ContactServer = ContactServer(args.batch_size, args.queue_size)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print(f"\n{server.validated} reports validated")
+
+
+if __name__ == "__main__":
+    main()
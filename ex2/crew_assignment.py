@@ -0,0 +1,141 @@
+from typing import NamedTuple
+from space_crew import (
+    LONG_MISSION,
+    MAX_CREW,
+    MAX_DURATION,
+    MIN_CREW,
+    MIN_EXPERIENCE,
+    CrewMember,
+    Rank,
+    SpaceMission)
+
+
+# Pool buckets, keyed by (leader, experienced), in the order each step
+# takes from them. Long missions come first and only take experienced
+# members; short ones keep experienced members and leaders for last.
+Bucket = tuple[bool, bool]
+LONG_LEADERS: tuple[Bucket, ...] = ((True, True),)
+SHORT_LEADERS: tuple[Bucket, ...] = ((True, False), (True, True))
+LONG_CREW: tuple[Bucket, ...] = ((False, True), (True, True))
+SHORT_CREW: tuple[Bucket, ...] = ((False, False), (False, True),
+                                  (True, False), (True, True))
+
+
+class MissionSpec(NamedTuple):
+    mission_id: str
+    duration_days: int
+    min_crew: int = MIN_CREW
+    max_crew: int = MAX_CREW
+
+
+class Staffing(NamedTuple):
+    crews: dict[str, list[CrewMember]]
+    # mission_id -> why it couldn't be staffed
+    unstaffed: dict[str, str]
+    unassigned: list[CrewMember]
+
+
+class CrewPool:
+    """Active members indexed by (leader, experienced) for the rules.
+
+    Inactive members are set aside for good: a mission can't take them.
+    Taking a member is a list pop.
+    """
+
+    def __init__(self, members: list[CrewMember]) -> None:
+        self.buckets: dict[Bucket, list[CrewMember]] = {
+            (leader, experienced): [] for leader in (True, False)
+            for experienced in (True, False)}
+        self.inactive: list[CrewMember] = []
+        commander: Rank = Rank.COMMANDER
+        captain: Rank = Rank.CAPTAIN
+        # Reversed so the stacks hand members out in pool order
+        for member in reversed(members):
+            if not member.is_active:
+                self.inactive.append(member)
+                continue
+            self.buckets[member.rank is commander or member.rank is captain,
+                         member.years_experience >= MIN_EXPERIENCE
+                         ].append(member)
+
+    def available(self, buckets: tuple[Bucket, ...]) -> int:
+        return sum(len(self.buckets[bucket]) for bucket in buckets)
+
+    def take(self, buckets: tuple[Bucket, ...], count: int
+             ) -> list[CrewMember]:
+        taken: list[CrewMember] = []
+        for bucket in buckets:
+            stack: list[CrewMember] = self.buckets[bucket]
+            while stack and len(taken) < count:
+                taken.append(stack.pop())
+        return taken
+
+    def members(self) -> list[CrewMember]:
+        return [member for stack in self.buckets.values()
+                for member in reversed(stack)] + self.inactive[::-1]
+
+
+def check_spec(spec: MissionSpec) -> None:
+    if not MIN_CREW <= spec.min_crew <= spec.max_crew <= MAX_CREW:
+        raise ValueError(f"{spec.mission_id}: crew size must be between"
+                         f" {MIN_CREW} and {MAX_CREW}.")
+    if not 1 <= spec.duration_days <= MAX_DURATION:
+        raise ValueError(f"{spec.mission_id}: duration_days must be between"
+                         f" 1 and {MAX_DURATION}.")
+
+
+def assign_crews(members: list[CrewMember], specs: list[MissionSpec]
+                 ) -> Staffing:
+    """Split a pool of validated members into crews for the missions.
+
+    Each crew has a captain or commander, only active members, and only
+    members with MIN_EXPERIENCE years or more on missions longer than
+    LONG_MISSION days, so check_mission_elements accepts it as is. Missions
+    get their minimum crew first, long and small ones first, so as many
+    as possible are staffed; leftover members then top them up to their
+    maximum. A mission the pool can't staff is left out with the reason.
+    Greedy: linear in members and missions, not an optimal matching.
+    """
+    seen: set[str] = set()
+    for spec in specs:
+        check_spec(spec)
+        if spec.mission_id in seen:
+            raise ValueError(f"Mission {spec.mission_id} is listed twice.")
+        seen.add(spec.mission_id)
+    pool: CrewPool = CrewPool(members)
+    crews: dict[str, list[CrewMember]] = {}
+    unstaffed: dict[str, str] = {}
+    order: list[MissionSpec] = sorted(
+        specs, key=lambda spec: (spec.duration_days <= LONG_MISSION,
+                                 spec.min_crew))
+    for spec in order:
+        long: bool = spec.duration_days > LONG_MISSION
+        leaders: tuple[Bucket, ...] = LONG_LEADERS if long else SHORT_LEADERS
+        crew: tuple[Bucket, ...] = LONG_CREW if long else SHORT_CREW
+        kind: str = "experienced " if long else ""
+        if not pool.available(leaders):
+            unstaffed[spec.mission_id] = f"no {kind}captain or commander left"
+            continue
+        # Checked before taking anyone, so a failure leaves the pool as is
+        if pool.available(crew) < spec.min_crew:
+            unstaffed[spec.mission_id] = (
+                f"{pool.available(crew)} {kind}members left for a crew of"
+                f" at least {spec.min_crew}")
+            continue
+        crews[spec.mission_id] = pool.take(leaders, 1)
+        crews[spec.mission_id] += pool.take(crew, spec.min_crew - 1)
+    for spec in order:
+        if spec.mission_id in crews:
+            crews[spec.mission_id] += pool.take(
+                LONG_CREW if spec.duration_days > LONG_MISSION
+                else SHORT_CREW,
+                spec.max_crew - len(crews[spec.mission_id]))
+    return Staffing({spec.mission_id: crews[spec.mission_id]
+                     for spec in specs if spec.mission_id in crews},
+                    unstaffed, pool.members())
+
+
+def staffed_mission(mission: dict, crew: list[CrewMember]) -> SpaceMission:
+    # The members are already CrewMember instances: pydantic keeps them as
+    # they are and only runs the mission checks
+    return SpaceMission.model_validate({**mission, "crew": crew})
@@ -0,0 +1,76 @@
+import sys
+from array import array
+from typing import Iterator
+from space_crew import CrewMember, Rank
+
+
+RANKS: list[Rank] = list(Rank)
+RANK_CODES: dict[Rank, int] = {rank: code for code, rank in enumerate(RANKS)}
+
+
+class CrewRoster:
+    """Read-only struct-of-arrays store of validated crew members.
+
+    One typed array per numeric field (rank as its index in Rank, age,
+    years_experience and is_active as single bytes) and specializations
+    dictionary-encoded against a shared vocabulary. Names are interned,
+    member ids are kept as they are. Rows convert back to CrewMember
+    without loss, and without validation since they were valid going in.
+    """
+
+    def __init__(self) -> None:
+        self.member_ids: list[str] = []
+        self.names: list[str] = []
+        self.ranks: array = array("B")
+        self.ages: array = array("B")
+        self.experience: array = array("B")
+        self.active: array = array("B")
+        self.specializations: array = array("I")
+        self.vocabulary: list[str] = []
+        self.vocabulary_codes: dict[str, int] = {}
+
+    @classmethod
+    def from_members(cls, members: list[CrewMember]) -> "CrewRoster":
+        roster: CrewRoster = cls()
+        for member in members:
+            roster._append(member)
+        return roster
+
+    def _append(self, member: CrewMember) -> None:
+        # Every value is checked before any column grows, so a member that
+        # doesn't fit leaves the columns the same length: bytes() raises
+        # on anything outside 0-255
+        row: bytes = bytes((RANK_CODES[member.rank], member.age,
+                            member.years_experience, member.is_active))
+        code: int | None = self.vocabulary_codes.get(member.specialization)
+        if code is None:
+            code = len(self.vocabulary)
+            self.vocabulary.append(sys.intern(member.specialization))
+            self.vocabulary_codes[member.specialization] = code
+        self.member_ids.append(member.member_id)
+        self.names.append(sys.intern(member.name))
+        self.ranks.append(row[0])
+        self.ages.append(row[1])
+        self.experience.append(row[2])
+        self.active.append(row[3])
+        self.specializations.append(code)
+
+    def __len__(self) -> int:
+        return len(self.member_ids)
+
+    def __getitem__(self, index: int) -> CrewMember:
+        return CrewMember.model_construct(
+            member_id=self.member_ids[index],
+            name=self.names[index],
+            rank=RANKS[self.ranks[index]],
+            age=self.ages[index],
+            specialization=self.vocabulary[self.specializations[index]],
+            years_experience=self.experience[index],
+            is_active=bool(self.active[index]))
+
+    def __iter__(self) -> Iterator[CrewMember]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_members(self) -> list[CrewMember]:
+        return list(self)
@@ -0,0 +1,98 @@
+from typing import Any
+from pydantic_core import PydanticCustomError
+from space_crew import (
+    MAX_CREW,
+    MAX_EXPERIENCE,
+    MIN_CREW,
+    CrewMember,
+    CrewStats,
+    Rank,
+    SpaceMission,
+    stats_rule_violations)
+
+
+class MissionHandle:
+    """Mutable crew of a validated mission with running rule state.
+
+    Keeps the leader count, a histogram of years_experience (so the
+    minimum survives removals) and the inactive count up to date, so adding,
+    removing or updating one member re-checks the leader, experience and
+    vacation rules in constant time instead of rebuilding the SpaceMission.
+    """
+
+    def __init__(self, mission: SpaceMission) -> None:
+        self.mission = mission
+        self.members: dict[str, CrewMember] = {}
+        self.leaders: int = 0
+        self.inactive: int = 0
+        self.experience: list[int] = [0] * (MAX_EXPERIENCE + 1)
+        self.min_experience: int = MAX_EXPERIENCE
+        for member in mission.crew:
+            self._count(member)
+
+    def _count(self, member: CrewMember) -> None:
+        if member.member_id in self.members:
+            raise ValueError(f"{member.member_id} is already on"
+                             f" {self.mission.mission_id}.")
+        self.members[member.member_id] = member
+        if member.rank is Rank.COMMANDER or member.rank is Rank.CAPTAIN:
+            self.leaders += 1
+        if not member.is_active:
+            self.inactive += 1
+        self.experience[member.years_experience] += 1
+        if member.years_experience < self.min_experience:
+            self.min_experience = member.years_experience
+
+    def _uncount(self, member_id: str) -> CrewMember:
+        member: CrewMember = self.members.pop(member_id)
+        if member.rank is Rank.COMMANDER or member.rank is Rank.CAPTAIN:
+            self.leaders -= 1
+        if not member.is_active:
+            self.inactive -= 1
+        self.experience[member.years_experience] -= 1
+        # At most 51 buckets to walk, whatever the crew size
+        while self.min_experience < MAX_EXPERIENCE and\
+                not self.experience[self.min_experience]:
+            self.min_experience += 1
+        return member
+
+    def add(self, member: CrewMember) -> list[PydanticCustomError]:
+        if len(self.members) >= MAX_CREW:
+            raise ValueError(f"{self.mission.mission_id} already has"
+                             f" {MAX_CREW} members.")
+        self._count(member)
+        return self.violations()
+
+    def remove(self, member_id: str) -> list[PydanticCustomError]:
+        if len(self.members) <= MIN_CREW:
+            raise ValueError(f"{self.mission.mission_id} needs at least"
+                             f" {MIN_CREW} member.")
+        self._uncount(member_id)
+        return self.violations()
+
+    def update(self, member_id: str, **changes: Any
+               ) -> list[PydanticCustomError]:
+        # Only the changed member is validated again
+        member: CrewMember = CrewMember.model_validate(
+            {**self.members[member_id].model_dump(), **changes})
+        if member.member_id != member_id and member.member_id in self.members:
+            raise ValueError(f"{member.member_id} is already on"
+                             f" {self.mission.mission_id}.")
+        self._uncount(member_id)
+        self._count(member)
+        return self.violations()
+
+    def stats(self) -> CrewStats:
+        return CrewStats(self.leaders, self.min_experience, self.inactive)
+
+    def violations(self, first_only: bool = False
+                   ) -> list[PydanticCustomError]:
+        return stats_rule_violations(self.mission.duration_days,
+                                     self.stats(), first_only)
+
+    def to_mission(self) -> SpaceMission:
+        # Full validation, check_mission_elements included
+        return SpaceMission.model_validate(
+            {**self.mission.model_dump(),
+             "crew": [member.model_dump()
+                      for member in self.members.values()]})
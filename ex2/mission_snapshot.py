@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta, timezone
+# space_crew puts the repository root on sys.path for shared/
+from space_crew import CrewMember, SpaceMission
+from crew_roster import RANK_CODES, RANKS
+from shared.snapshot import (
+    BOOL,
+    STRING,
+    Column,
+    read_snapshot,
+    trusted_factory,
+    write_snapshot)
+
+
+KIND: int = 2
+EPOCH: datetime = datetime(1970, 1, 1)
+# utc_offset of a naive launch_date
+NAIVE: int = -(1 << 31)
+
+# One row per mission, then its crew_size members in order in the member
+# table
+MISSION_COLUMNS: list[Column] = [
+    Column("mission_id", STRING),
+    Column("mission_name", STRING),
+    Column("destination", STRING),
+    # Wall-clock microseconds since EPOCH, and the UTC offset in seconds
+    Column("launch_date", "q"),
+    Column("utc_offset", "i"),
+    Column("duration_days", "h"),
+    Column("mission_status", STRING),
+    Column("budget_millions", "d"),
+    Column("crew_size", "B"),
+]
+MEMBER_COLUMNS: list[Column] = [
+    Column("member_id", STRING),
+    Column("name", STRING),
+    Column("rank", "B"),
+    Column("age", "B"),
+    Column("specialization", STRING),
+    Column("years_experience", "B"),
+    Column("is_active", BOOL),
+]
+
+
+def _utc_offset(launch_date: datetime) -> int:
+    offset: timedelta | None = launch_date.utcoffset()
+    return NAIVE if offset is None else int(offset.total_seconds())
+
+
+def save_missions(path: str, missions: list[SpaceMission]) -> None:
+    members: list[CrewMember] = [member for mission in missions
+                                 for member in mission.crew]
+    write_snapshot(path, KIND, [
+        (MISSION_COLUMNS, {
+            "mission_id": [m.mission_id for m in missions],
+            "mission_name": [m.mission_name for m in missions],
+            "destination": [m.destination for m in missions],
+            "launch_date": [
+                (m.launch_date.replace(tzinfo=None) - EPOCH)
+                // timedelta(microseconds=1) for m in missions],
+            "utc_offset": [_utc_offset(m.launch_date) for m in missions],
+            "duration_days": [m.duration_days for m in missions],
+            "mission_status": [m.mission_status for m in missions],
+            "budget_millions": [m.budget_millions for m in missions],
+            "crew_size": [len(m.crew) for m in missions],
+        }),
+        (MEMBER_COLUMNS, {
+            "member_id": [c.member_id for c in members],
+            "name": [c.name for c in members],
+            "rank": [RANK_CODES[c.rank] for c in members],
+            "age": [c.age for c in members],
+            "specialization": [c.specialization for c in members],
+            "years_experience": [c.years_experience for c in members],
+            "is_active": [c.is_active for c in members],
+        }),
+    ])
+
+
+def load_missions(path: str) -> list[SpaceMission]:
+    """Reload missions saved by save_missions() without validating them.
+
+    check_mission_elements isn't run again either. Only trust snapshots
+    this program wrote: the checksum catches a damaged file, not a forged
+    one.
+    """
+    missions, members = read_snapshot(path, KIND,
+                                      [MISSION_COLUMNS, MEMBER_COLUMNS])
+    build_member = trusted_factory(CrewMember)
+    crew: list[CrewMember] = [
+        build_member({"member_id": member_id, "name": name,
+                      "rank": RANKS[rank], "age": age,
+                      "specialization": specialization,
+                      "years_experience": years_experience,
+                      "is_active": is_active})
+        for (member_id, name, rank, age, specialization, years_experience,
+             is_active)
+        in zip(*(members[column.name] for column in MEMBER_COLUMNS))]
+    start: int = 0
+    zones: dict[int, timezone] = {}
+    build = trusted_factory(SpaceMission)
+    result: list[SpaceMission] = []
+    for (mission_id, mission_name, destination, launch_date, offset,
+         duration_days, mission_status, budget_millions, crew_size) in zip(
+            *(missions[column.name] for column in MISSION_COLUMNS)):
+        launched: datetime = EPOCH + timedelta(microseconds=launch_date)
+        if offset != NAIVE:
+            if offset not in zones:
+                zones[offset] = timezone(timedelta(seconds=offset))
+            launched = launched.replace(tzinfo=zones[offset])
+        result.append(build({
+            "mission_id": mission_id, "mission_name": mission_name,
+            "destination": destination, "launch_date": launched,
+            "duration_days": duration_days,
+            "crew": crew[start:start + crew_size],
+            "mission_status": mission_status,
+            "budget_millions": budget_millions}))
+        start += crew_size
+    return result
@@ -12,15 +12,21 @@
 
 try:
     import sys
+    from pathlib import Path
     from datetime import datetime
+    from typing import Callable, NamedTuple
     from typing_extensions import Self
     from enum import Enum
     from pydantic import (
         BaseModel,
+        ConfigDict,
         Field,
         ValidationError,
         model_validator)
-    from pydantic_core import PydanticCustomError
+    from pydantic_core import ErrorDetails, PydanticCustomError
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from shared.profiling import profiled
+    from shared.report import MODES, ReportWriter, error_lines
 except (ImportError, ModuleNotFoundError)as e:
     print(e)
     sys.exit(1)
@@ -34,59 +40,203 @@ class Rank(Enum):
     COMMANDER = "commander"
 
 
+# Limits shared by the models, the mission rules and the crew tools built
+# on them (MissionHandle, assign_crews)
+MIN_CREW: int = 1
+MAX_CREW: int = 12
+MAX_DURATION: int = 3650
+MAX_EXPERIENCE: int = 50
+# Crews of missions longer than LONG_MISSION days need MIN_EXPERIENCE years
+LONG_MISSION: int = 365
+MIN_EXPERIENCE: int = 5
+
+
 class CrewMember(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     member_id: str = Field(min_length=3, max_length=10)
     name: str = Field(min_length=2, max_length=50)
     rank: Rank
     age: int = Field(ge=18, le=80)
     specialization: str = Field(min_length=3, max_length=30)
-    years_experience: int = Field(ge=0, le=50)
+    years_experience: int = Field(ge=0, le=MAX_EXPERIENCE)
     is_active: bool = True
 
 
+class CrewStats(NamedTuple):
+    leaders: int
+    min_experience: int
+    inactive: int
+
+
+def crew_stats(crew: list[CrewMember]) -> CrewStats:
+    # Everything the mission rules need, gathered in one walk over the crew
+    leaders: int = 0
+    min_experience: int = MAX_EXPERIENCE
+    inactive: int = 0
+    commander: Rank = Rank.COMMANDER
+    captain: Rank = Rank.CAPTAIN
+    for member in crew:
+        # Identity checks: Enum.__hash__ is Python code, so a set lookup
+        # would cost a call per member
+        if member.rank is commander or member.rank is captain:
+            leaders += 1
+        if member.years_experience < min_experience:
+            min_experience = member.years_experience
+        if not member.is_active:
+            inactive += 1
+    return CrewStats(leaders, min_experience, inactive)
+
+
+# (error type, message, broken when) checked in this order. The error types
+# are part of the output, keep them stable.
+MISSION_RULES: tuple[tuple[str, str, Callable[[int, CrewStats], bool]],
+                     ...] = (
+    ("No leader",
+     "How do you except a group to function properly without a leader?",
+     lambda duration_days, stats: stats.leaders == 0),
+    ("Experienceless",
+     "Longest missions are assigned to experimented groups.",
+     lambda duration_days, stats: duration_days > LONG_MISSION
+     and stats.min_experience < MIN_EXPERIENCE),
+    ("Vacation time",
+     "Always on vacation these members (or dead^^)!",
+     lambda duration_days, stats: stats.inactive > 0),
+)
+
+
+def mission_rule_violations(duration_days: int, crew: list[CrewMember],
+                            first_only: bool = False
+                            ) -> list[PydanticCustomError]:
+    """Check the crew rules of a mission in a single pass over its crew.
+
+    Returns every broken rule as the PydanticCustomError
+    check_mission_elements raises, or only the first one with `first_only`.
+    """
+    return stats_rule_violations(duration_days, crew_stats(crew), first_only)
+
+
+def stats_rule_violations(duration_days: int, stats: CrewStats,
+                          first_only: bool = False
+                          ) -> list[PydanticCustomError]:
+    violations: list[PydanticCustomError] = []
+    for error_type, message, broken in MISSION_RULES:
+        if broken(duration_days, stats):
+            violations.append(PydanticCustomError(error_type, message))
+            if first_only:
+                break
+    return violations
+
+
 class SpaceMission(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     mission_id: str = Field(min_length=5, max_length=15)
     mission_name: str = Field(min_length=3, max_length=100)
     destination: str = Field(min_length=3, max_length=50)
     launch_date: datetime
-    duration_days: int = Field(ge=1, le=3650)
-    crew: list[CrewMember] = Field(min_length=1, max_length=12)
+    duration_days: int = Field(ge=1, le=MAX_DURATION)
+    crew: list[CrewMember] = Field(min_length=MIN_CREW, max_length=MAX_CREW)
     mission_status: str = "planned"
     budget_millions: float = Field(ge=1, le=10000)
 
     @model_validator(mode='after')
+    @profiled
     def check_mission_elements(self) -> Self:
         if not self.mission_id.startswith("M"):
             raise ValueError("Mission_id must begin with an 'M'.")
-        commander_list: list[CrewMember] = [commander for commander in
-                                            self.crew if commander.rank ==
-                                            Rank.COMMANDER]
-        captain_list: list[CrewMember] = [captain for captain in
-                                          self.crew if captain.rank ==
-                                          Rank.CAPTAIN]
-        if len(commander_list) == 0 and len(captain_list) == 0:
-            raise PydanticCustomError(
-                "No leader",
-                "How do you except a group to function"
-                " properly without a leader?",
-                                  )
-        if self.duration_days > 365:
-            for member in self.crew:
-                if member.years_experience < 5:
-                    raise PydanticCustomError(
-                        "Experienceless",
-                        "Longest missions are assigned to experimented groups."
-                        )
-        for member in self.crew:
-            if not member.is_active:
-                raise PydanticCustomError(
-                    "Vacation time",
-                    "Always on vacation these members (or dead^^)!"
-                    )
+        violations: list[PydanticCustomError] = mission_rule_violations(
+            self.duration_days, self.crew, first_only=True)
+        if violations:
+            raise violations[0]
         return self
 
 
+class MissionRegistry:
+    """Validated missions and their crew, indexed by id.
+
+    Every lookup and insertion is a dict operation: a mission whose id is
+    already registered, or with a member already on another mission, is
+    rejected without scanning the fleet.
+    """
+
+    def __init__(self) -> None:
+        self.missions: dict[str, SpaceMission] = {}
+        self.members: dict[str, CrewMember] = {}
+        self.assignments: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.missions)
+
+    def add(self, mission: SpaceMission) -> None:
+        if mission.mission_id in self.missions:
+            raise ValueError(f"Mission {mission.mission_id} is already"
+                             " registered.")
+        # Checked before touching the indexes so a rejected mission leaves
+        # nothing behind
+        seen: set[str] = set()
+        for member in mission.crew:
+            if member.member_id in seen:
+                raise ValueError(f"{member.member_id} appears twice in"
+                                 f" {mission.mission_id}.")
+            if member.member_id in self.assignments:
+                raise ValueError(
+                    f"{member.member_id} is already assigned to"
+                    f" {self.assignments[member.member_id]}.")
+            seen.add(member.member_id)
+        self.missions[mission.mission_id] = mission
+        for member in mission.crew:
+            self.members[member.member_id] = member
+            self.assignments[member.member_id] = mission.mission_id
+
+    def remove(self, mission_id: str) -> SpaceMission:
+        mission: SpaceMission = self.missions.pop(mission_id)
+        for member in mission.crew:
+            del self.members[member.member_id]
+            del self.assignments[member.member_id]
+        return mission
+
+    def get(self, mission_id: str) -> SpaceMission | None:
+        return self.missions.get(mission_id)
+
+    def member(self, member_id: str) -> CrewMember | None:
+        return self.members.get(member_id)
+
+    def mission_of(self, member_id: str) -> SpaceMission | None:
+        mission_id: str | None = self.assignments.get(member_id)
+        return None if mission_id is None else self.missions[mission_id]
+
+
+def ingest_mission(mission: dict) -> SpaceMission:
+    # Single pass: SpaceMission builds its nested crew itself, so each member
+    # is validated once and a bad one is reported as crew.<index>.<field>
+    return SpaceMission.model_validate(mission)
+
+
+def mission_text(mission: SpaceMission) -> str:
+    crew: str = "".join(f"- {member.name} ({member.rank.value}) -"
+                        f" {member.specialization}\n"
+                        for member in mission.crew)
+    return ("\nValid mission created:\n"
+            f"ID: {mission.mission_id}\n"
+            f"Destination: {mission.destination}\n"
+            f"Duration: {mission.duration_days}\n"
+            f"Budget: {mission.budget_millions}\n"
+            f"Crew size: {len(mission.crew)}\n"
+            f"Crew members:\n{crew}{'='*60}\n")
+
+
+def mission_error_text(name: str, errors: list[ErrorDetails]) -> str:
+    return f"\nUnexpected {name} error:\n{error_lines(errors)}{'='*60}\n"
+
+
 def main():
+    from argparse import ArgumentParser
+    parser: ArgumentParser = ArgumentParser(
+        description="Validate the sample space missions.")
+    parser.add_argument("--format", choices=MODES, default="text",
+                        help="report layout (default: text)")
+    args = parser.parse_args()
     space_missions = [
         {
             'mission_id': 'M2024_TITAN',
@@ -396,48 +546,27 @@ def main():
             'budget_millions': 1092.6
         }
     ]
-    validated_missions: list[SpaceMission] = []
-    for mission in space_missions:
-        try:
-            validated_crew: list[CrewMember] = []
-            for member in mission["crew"]:
-                try:
-                    validated_crew.append(CrewMember(**member))
-                except (ValidationError, Exception) as e:
-                    print("Expected CrewMember validation error:")
-                    for error in e.errors():
-                        loc: str = "" if not error["loc"] else\
-                                f"{error['loc'][0]}: "
-                        print(f"{loc}{error['msg']}")
-                    print("="*60)
-            validated_missions.append(SpaceMission(
-                mission_id=mission["mission_id"],
-                mission_name=mission["mission_name"],
-                destination=mission["destination"],
-                launch_date=mission["launch_date"],
-                duration_days=mission["duration_days"],
-                crew=validated_crew,
-                mission_status=mission["mission_status"],
-                budget_millions=mission["budget_millions"],
-            ))
-        except (ValidationError, Exception) as e:
-            print(f"\nUnexpected {mission['mission_name']} error:")
-            for error in e.errors():
-                loc: str = "" if not error["loc"] else f"{error['loc'][0]}: "
-                print(f"{loc}{error['msg']}")
-            print("="*60)
-    for mission in validated_missions:
-        print("\nValid mission created:")
-        print(f"ID: {mission.mission_id}")
-        print(f"Destination: {mission.destination}")
-        print(f"Duration: {mission.duration_days}")
-        print(f"Budget: {mission.budget_millions}")
-        print(f"Crew size: {len(mission.crew)}")
-        print("Crew members:")
-        for member in mission.crew:
-            print(f"- {member.name} ({member.rank.value}) -"
-                  f" {member.specialization}")
-        print("="*60)
+    registry: MissionRegistry = MissionRegistry()
+    accepted: list[tuple[int, SpaceMission]] = []
+    with ReportWriter(SpaceMission, mission_text, mission_error_text,
+                      args.format) as report:
+        for index, mission in enumerate(space_missions):
+            try:
+                validated: SpaceMission = ingest_mission(mission)
+                registry.add(validated)
+                accepted.append((index, validated))
+            except ValidationError as e:
+                report.rejected(index, e.errors(include_url=False,
+                                                **report.error_options),
+                                mission["mission_name"], mission)
+            except ValueError as e:
+                # Rejected by the registry, shown like a model validator
+                # error
+                report.rejected(index, [{"type": "duplicate_id", "loc": (),
+                                         "msg": str(e), "input": mission}],
+                                mission["mission_name"], mission)
+        for index, validated in accepted:
+            report.accepted(index, validated)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,79 @@
+from typing import Any
+from pydantic_core import ErrorDetails
+
+
+SAMPLES: int = 3
+# Examples are shown on one line each, cut to that many characters
+EXAMPLE_WIDTH: int = 100
+
+# (model, field loc, error type): list indexes are folded into "*" so
+# crew.3.age and crew.7.age land in the same bucket. Model validator errors
+# have an empty loc and are told apart by their error type alone.
+Bucket = tuple[str, tuple, str]
+
+
+def bucket_loc(loc: tuple) -> tuple:
+    for part in loc:
+        if type(part) is int:
+            return tuple("*" if type(part) is int else part for part in loc)
+    return loc
+
+
+class ErrorStats:
+    """Counts validation failures instead of formatting them.
+
+    add() only builds a tuple key per error and bumps a counter; messages
+    are never read. The first `samples` records of each bucket are kept as
+    examples. Feed it e.errors(include_url=False, include_context=False,
+    include_input=False) to keep pydantic's side cheap too.
+    """
+
+    def __init__(self, samples: int = SAMPLES) -> None:
+        self.samples = samples
+        self.counts: dict[Bucket, int] = {}
+        self.examples: dict[Bucket, list[Any]] = {}
+        self.records: dict[str, int] = {}
+        self.rejected: dict[str, int] = {}
+
+    def accepted(self, model: str) -> None:
+        self.records[model] = self.records.get(model, 0) + 1
+
+    def add(self, model: str, errors: list[ErrorDetails],
+            record: Any = None) -> None:
+        self.records[model] = self.records.get(model, 0) + 1
+        self.rejected[model] = self.rejected.get(model, 0) + 1
+        counts: dict[Bucket, int] = self.counts
+        for error in errors:
+            key: Bucket = (model, bucket_loc(error["loc"]), error["type"])
+            count: int = counts.get(key, 0)
+            counts[key] = count + 1
+            if count < self.samples and record is not None:
+                self.examples.setdefault(key, []).append(record)
+
+    def rows(self) -> list[dict[str, Any]]:
+        # Most frequent first
+        return [{"model": model,
+                 "loc": ".".join(str(part) for part in loc),
+                 "type": error_type,
+                 "count": count,
+                 "examples": self.examples.get((model, loc, error_type), [])}
+                for (model, loc, error_type), count in sorted(
+                    self.counts.items(), key=lambda item: -item[1])]
+
+    def text(self) -> str:
+        lines: list[str] = []
+        for model, total in self.records.items():
+            rejected: int = self.rejected.get(model, 0)
+            lines.append(f"{model}: {total} records, {rejected} rejected")
+        rows: list[dict[str, Any]] = self.rows()
+        width: int = max((len(row["loc"]) for row in rows), default=0)
+        for row in rows:
+            loc: str = row["loc"] or "(model)"
+            lines.append(f"  {row['count']:>8}  {row['model']}"
+                         f"  {loc:<{max(width, 7)}}  {row['type']}")
+            for example in row["examples"]:
+                text: str = repr(example)
+                if len(text) > EXAMPLE_WIDTH:
+                    text = text[:EXAMPLE_WIDTH - 3] + "..."
+                lines.append(f"            e.g. {text}")
+        return "\n".join(lines) + "\n"
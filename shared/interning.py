@@ -0,0 +1,120 @@
+import sys
+from array import array
+from typing import Any, Callable, Iterable
+from pydantic import BaseModel
+
+
+# Text fields drawn from small vocabularies, per model class name. Nested
+# models are interned through the fields in NESTED_FIELDS.
+TEXT_FIELDS: dict[str, tuple[str, ...]] = {
+    "StationModel": ("name", "notes"),
+    "AlienContact": ("location",),
+    "CrewMember": ("specialization",),
+    "SpaceMission": ("destination", "mission_status"),
+}
+NESTED_FIELDS: dict[str, tuple[str, ...]] = {
+    "SpaceMission": ("crew",),
+}
+
+
+class Vocabulary:
+    # Distinct values of one field (None included for optional fields); a
+    # value's code is its index in values
+    __slots__ = ("values", "codes", "references", "saved")
+
+    def __init__(self) -> None:
+        self.values: list[str | None] = []
+        self.codes: dict[str | None, int] = {}
+        self.references: int = 0
+        self.saved: int = 0
+
+    def canonical(self, value: str | None) -> str | None:
+        self.references += 1
+        code: int | None = self.codes.get(value)
+        if code is None:
+            self.codes[value] = len(self.values)
+            self.values.append(value)
+            return value
+        shared: str | None = self.values[code]
+        if shared is not value:
+            self.saved += sys.getsizeof(value)
+        return shared
+
+
+class Interner:
+    """Dictionary encoding of repeated text fields, after validation.
+
+    intern() swaps every TEXT_FIELDS value of the given models for one
+    shared string per distinct value, in place: the models were validated
+    already and the value is equal, only the object changes. Each field
+    gets its own Vocabulary, so values also have a small integer code for
+    grouping and sorting. A copy is only freed once nothing else (like the
+    raw record) holds it, `saved` counts what becomes collectable.
+    """
+
+    def __init__(self) -> None:
+        self.vocabularies: dict[tuple[str, str], Vocabulary] = {}
+
+    def vocabulary(self, model: str, field: str) -> Vocabulary:
+        vocabulary: Vocabulary | None = self.vocabularies.get((model, field))
+        if vocabulary is None:
+            vocabulary = self.vocabularies[model, field] = Vocabulary()
+        return vocabulary
+
+    def intern(self, models: Iterable[BaseModel]) -> None:
+        self._intern(models, {})
+
+    def _intern(self, models: Iterable[BaseModel], plans: dict[type, tuple[
+            list[tuple[str, Callable]], tuple[str, ...]]]) -> None:
+        # plans: (field, Vocabulary.canonical) pairs and nested fields, per
+        # class, shared with the nested calls
+        for model in models:
+            plan = plans.get(type(model))
+            if plan is None:
+                name: str = type(model).__name__
+                plan = plans[type(model)] = (
+                    [(field, self.vocabulary(name, field).canonical)
+                     for field in TEXT_FIELDS.get(name, ())],
+                    NESTED_FIELDS.get(name, ()))
+            values: dict[str, Any] = model.__dict__
+            for field, canonical in plan[0]:
+                values[field] = canonical(values[field])
+            for field in plan[1]:
+                self._intern(values[field], plans)
+
+    def codes(self, models: list[BaseModel], field: str) -> array:
+        # Only for models that went through intern(). Interned values hit
+        # the code table on identity, no string compare
+        if not models:
+            return array("I")
+        vocabulary: Vocabulary = self.vocabulary(type(models[0]).__name__,
+                                                 field)
+        code = vocabulary.codes
+        return array("I", [code[model.__dict__[field]] for model in models])
+
+    def group(self, models: list[BaseModel], field: str
+              ) -> dict[str | None, list[BaseModel]]:
+        if not models:
+            return {}
+        values: list[str | None] = self.vocabulary(
+            type(models[0]).__name__, field).values
+        code: dict[str | None, int] = self.vocabulary(
+            type(models[0]).__name__, field).codes
+        groups: list[list[BaseModel]] = [[] for _ in values]
+        for model in models:
+            groups[code[model.__dict__[field]]].append(model)
+        return {values[code]: members for code, members in enumerate(groups)
+                if members}
+
+    def saved(self) -> int:
+        return sum(vocabulary.saved
+                   for vocabulary in self.vocabularies.values())
+
+    def report(self) -> str:
+        lines: list[str] = []
+        for (model, field), vocabulary in self.vocabularies.items():
+            lines.append(f"{model}.{field}: {vocabulary.references} values,"
+                         f" {len(vocabulary.values)} distinct,"
+                         f" {vocabulary.saved / 1024:.0f} KiB saved")
+        lines.append(f"Total: {self.saved() / 1024:.0f} KiB saved")
+        return "\n".join(lines) + "\n"
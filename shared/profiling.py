@@ -0,0 +1,218 @@
+from datetime import date
+from enum import Enum
+from functools import wraps
+from time import perf_counter_ns
+from typing import Annotated, Any, Callable, TypeVar, get_args
+from pydantic import BaseModel, ValidationError
+from pydantic.fields import FieldInfo
+
+
+# Log-linear buckets, four per power of two: below 4 ns one bucket per
+# nanosecond, then e.g. 1024-1279, 1280-1535, 1536-1791, 1792-2047
+BUCKETS: int = 160
+
+# (model, kind, name): kind is "model" for a whole validation, "field" for
+# one field validated on its own, "group" for every field of a group (see
+# field_group()), "validator" for a model validator and "baseline" for the
+# cost of an adapter call that validates nothing
+Key = tuple[str, str, str]
+Function = TypeVar("Function", bound=Callable)
+
+
+def bucket_of(ns: int) -> int:
+    bits: int = ns.bit_length()
+    if bits <= 2:
+        return ns
+    return min((bits - 2) * 4 + ((ns >> (bits - 3)) & 3), BUCKETS - 1)
+
+
+def bucket_high(bucket: int) -> int:
+    # Largest timing that lands in `bucket`
+    if bucket < 4:
+        return bucket
+    shift: int = bucket // 4 - 1
+    return ((5 + bucket % 4) << shift) - 1
+
+
+def field_group(field: FieldInfo) -> str:
+    # What pydantic-core mostly spends its time on for that field
+    types: tuple = get_args(field.annotation) or (field.annotation,)
+    if any(isinstance(kind, type) and issubclass(kind, BaseModel)
+           for kind in types):
+        return "nested models"
+    if any(isinstance(kind, type) and issubclass(kind, date)
+           for kind in types):
+        return "datetime parsing"
+    if any(isinstance(kind, type) and issubclass(kind, Enum)
+           for kind in types):
+        return "enums"
+    if field.metadata:
+        return "constraints"
+    return "plain"
+
+
+class Histogram:
+    __slots__ = ("count", "total", "low", "high", "buckets")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: int = 0
+        self.low: int = 0
+        self.high: int = 0
+        self.buckets: list[int] = [0] * BUCKETS
+
+    def add(self, ns: int) -> None:
+        if not self.count or ns < self.low:
+            self.low = ns
+        if ns > self.high:
+            self.high = ns
+        self.count += 1
+        self.total += ns
+        self.buckets[bucket_of(ns)] += 1
+
+    def percentile(self, percent: float) -> int:
+        # Upper bound of the bucket holding that rank, capped by the
+        # slowest timing seen
+        rank: float = self.count * percent / 100
+        seen: int = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(bucket_high(bucket), self.high)
+        return self.high
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"count": self.count, "total_ns": self.total,
+                "min_ns": self.low, "max_ns": self.high,
+                "p50_ns": self.percentile(50), "p99_ns": self.percentile(99),
+                # [highest ns of the bucket, count], empty buckets left out
+                "buckets": [[bucket_high(bucket), count] for bucket, count
+                            in enumerate(self.buckets) if count]}
+
+
+class ValidationProfiler:
+    """Timing histograms of model validations, fields and model validators.
+
+    pydantic-core validates the fields of a model in one native call, so
+    fields are timed by validating each one again on its own through a
+    TypeAdapter built from its Field (profile_fields()). Model validators
+    decorated with @profiled are timed in place while the profiler is
+    enabled; when it isn't, they pay one global lookup per call.
+
+        profiler = enable()
+        profiler.validate(AlienContact, record)
+        profiler.profile_fields(AlienContact, record)
+        disable()
+        print(profiler.report())
+    """
+
+    def __init__(self) -> None:
+        # TypeAdapter only when profiling: the scripts import this module
+        # for @profiled and must start fast
+        from pydantic import TypeAdapter
+        self.adapter_type: type = TypeAdapter
+        self.baseline: Any = TypeAdapter(Any)
+        self.histograms: dict[Key, Histogram] = {}
+        self.adapters: dict[tuple[type, str], tuple[Any, str]] = {}
+
+    def record(self, model: str, kind: str, name: str, ns: int) -> None:
+        histogram: Histogram | None = self.histograms.get((model, kind, name))
+        if histogram is None:
+            histogram = self.histograms[model, kind, name] = Histogram()
+        histogram.add(ns)
+
+    def validate(self, model: type[BaseModel], data: Any) -> BaseModel:
+        # Timed whether it passes or not, ValidationError is raised as usual
+        started: int = perf_counter_ns()
+        try:
+            return model.model_validate(data)
+        finally:
+            self.record(model.__name__, "model", "total",
+                        perf_counter_ns() - started)
+
+    def _adapter(self, model: type[BaseModel], name: str
+                 ) -> tuple[Any, str]:
+        adapter: tuple[Any, str] | None = self.adapters.get((model, name))
+        if adapter is None:
+            field: FieldInfo = model.model_fields[name]
+            adapter = self.adapters[model, name] = (
+                self.adapter_type(Annotated[field.annotation, field]),
+                field_group(field))
+        return adapter
+
+    def profile_fields(self, model: type[BaseModel], data: dict) -> None:
+        started: int = perf_counter_ns()
+        self.baseline.validate_python(None)
+        self.record("", "baseline", "adapter call",
+                    perf_counter_ns() - started)
+        for name in model.model_fields:
+            if name not in data:
+                continue
+            adapter, group = self._adapter(model, name)
+            started = perf_counter_ns()
+            try:
+                adapter.validate_python(data[name])
+            except ValidationError:
+                pass
+            elapsed: int = perf_counter_ns() - started
+            self.record(model.__name__, "field", name, elapsed)
+            self.record(model.__name__, "group", group, elapsed)
+
+    def rows(self) -> list[dict[str, Any]]:
+        return [{"model": model, "kind": kind, "name": name,
+                 **histogram.to_dict()}
+                for (model, kind, name), histogram in sorted(
+                    self.histograms.items())]
+
+    def report(self) -> str:
+        lines: list[str] = [f"{'model':<14} {'kind':<9} {'name':<22}"
+                            f" {'count':>8} {'mean us':>9} {'p50 us':>8}"
+                            f" {'p99 us':>8} {'max us':>8}"]
+        for row in self.rows():
+            lines.append(f"{row['model']:<14} {row['kind']:<9}"
+                         f" {row['name']:<22} {row['count']:>8}"
+                         f" {row['total_ns'] / row['count'] / 1000:>9.2f}"
+                         f" {row['p50_ns'] / 1000:>8.2f}"
+                         f" {row['p99_ns'] / 1000:>8.2f}"
+                         f" {row['max_ns'] / 1000:>8.2f}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self) -> str:
+        import json
+        return json.dumps({"version": 1, "histograms": self.rows()})
+
+
+profiler: ValidationProfiler | None = None
+
+
+def enable(active: ValidationProfiler | None = None) -> ValidationProfiler:
+    global profiler
+    profiler = active or ValidationProfiler()
+    return profiler
+
+
+def disable() -> None:
+    global profiler
+    profiler = None
+
+
+def profiled(function: Function) -> Function:
+    """Time a model validator into the enabled profiler, if there is one.
+
+    Goes under @model_validator(mode="after"); the histogram is named
+    after the validator's qualified name, e.g. AlienContact / check_values.
+    """
+    model, _, name = function.__qualname__.rpartition(".")
+
+    @wraps(function)
+    def timed(self: Any) -> Any:
+        active: ValidationProfiler | None = profiler
+        if active is None:
+            return function(self)
+        started: int = perf_counter_ns()
+        try:
+            return function(self)
+        finally:
+            active.record(model, "validator", name,
+                          perf_counter_ns() - started)
+    return timed  # type: ignore[return-value]
@@ -0,0 +1,153 @@
+import sys
+import csv
+import io
+from typing import Any, Callable, TextIO
+from pydantic import BaseModel
+from pydantic_core import ErrorDetails
+from shared.error_stats import ErrorStats
+
+
+MODES: tuple[str, ...] = ("text", "jsonl", "csv", "summary", "stats")
+BUFFER_SIZE: int = 1 << 16
+
+
+def error_location(error: ErrorDetails) -> str:
+    return ".".join(str(part) for part in error["loc"])
+
+
+def error_lines(errors: list[ErrorDetails]) -> str:
+    # Model validator errors have no loc, only their message is shown
+    return "".join(f"{error_location(error)}: {error['msg']}\n"
+                   if error["loc"] else f"{error['msg']}\n"
+                   for error in errors)
+
+
+class ReportWriter:
+    """Buffered renderer for validation results.
+
+    Every record is rendered to a string and appended to an in-memory
+    buffer that is written out in one call once it holds `buffer_size`
+    characters, instead of one print() per line.
+
+    Modes:
+        text     the scripts' own layout, given by `valid_text(model)` and
+                 `error_text(name, errors)`
+        jsonl    one JSON object per record
+        csv      one row per record, one column per field of `model`
+        summary  nothing per record, only the counts on close()
+        stats    failures counted by (model, field, error type) with a few
+                 example records each, shown on close()
+    """
+
+    def __init__(self, model: type[BaseModel],
+                 valid_text: Callable[[Any], str],
+                 error_text: Callable[[str, list[ErrorDetails]], str],
+                 mode: str = "text", stream: TextIO | None = None,
+                 buffer_size: int = BUFFER_SIZE) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown report mode {mode!r}, expected one"
+                             f" of {', '.join(MODES)}")
+        self.model = model
+        self.valid_text = valid_text
+        self.error_text = error_text
+        self.mode = mode
+        self.stream = stream or sys.stdout
+        self.buffer_size = buffer_size
+        self.buffer: list[str] = []
+        self.buffered: int = 0
+        self.accepted_count: int = 0
+        self.rejected_count: int = 0
+        self.fields: list[str] = list(model.model_fields)
+        self.stats: ErrorStats = ErrorStats()
+        # Passed to ValidationError.errors() by the callers: stats mode
+        # only reads loc and type
+        self.error_options: dict[str, bool] = {
+            "include_context": False, "include_input": False
+        } if mode == "stats" else {}
+        self.csv_line: io.StringIO = io.StringIO()
+        self.csv_writer = csv.writer(self.csv_line, lineterminator="\n")
+        if mode == "csv":
+            self._write(self._csv_row(["index", "status", *self.fields,
+                                       "errors"]))
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _write(self, text: str) -> None:
+        self.buffer.append(text)
+        self.buffered += len(text)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.stream.write("".join(self.buffer))
+            self.buffer.clear()
+            self.buffered = 0
+        self.stream.flush()
+
+    def _csv_row(self, values: list) -> str:
+        self.csv_line.seek(0)
+        self.csv_line.truncate()
+        self.csv_writer.writerow(values)
+        return self.csv_line.getvalue()
+
+    @staticmethod
+    def _json(value: Any) -> str:
+        # json isn't loaded by pydantic, only pay for it in jsonl/csv mode
+        import json
+        return json.dumps(value)
+
+    @staticmethod
+    def _json_errors(errors: list[ErrorDetails]) -> list[dict]:
+        return [{"loc": error_location(error), "type": error["type"],
+                 "msg": error["msg"]} for error in errors]
+
+    def accepted(self, index: int, model: BaseModel) -> None:
+        self.accepted_count += 1
+        if self.mode == "stats":
+            self.stats.accepted(self.model.__name__)
+        elif self.mode == "text":
+            self._write(self.valid_text(model))
+        elif self.mode == "jsonl":
+            # The record is serialized by pydantic-core, not json.dumps
+            self._write(f'{{"index": {index}, "status": "valid", "record":'
+                        f' {model.model_dump_json()}}}\n')
+        elif self.mode == "csv":
+            record: dict = model.model_dump(mode="json")
+            self._write(self._csv_row(
+                [index, "valid",
+                 *(self._json(value) if isinstance(value, (list, dict))
+                   else value for value in record.values()), ""]))
+
+    def rejected(self, index: int, errors: list[ErrorDetails],
+                 name: str = "", record: Any = None) -> None:
+        self.rejected_count += 1
+        if self.mode == "stats":
+            self.stats.add(self.model.__name__, errors, record)
+        elif self.mode == "text":
+            self._write(self.error_text(name, errors))
+        elif self.mode == "jsonl":
+            line: dict = {"index": index, "status": "rejected"}
+            if name:
+                line["name"] = name
+            line["errors"] = self._json_errors(errors)
+            self._write(self._json(line) + "\n")
+        elif self.mode == "csv":
+            self._write(self._csv_row(
+                [index, "rejected", *([""] * len(self.fields)),
+                 "; ".join(line for line in error_lines(errors).split("\n")
+                           if line)]))
+
+    def close(self) -> None:
+        if self.mode == "summary":
+            total: int = self.accepted_count + self.rejected_count
+            self._write(f"{self.model.__name__}: {total} records,"
+                        f" {self.accepted_count} valid,"
+                        f" {self.rejected_count} rejected\n")
+        elif self.mode == "stats":
+            self._write(self.stats.text())
+        self.flush()
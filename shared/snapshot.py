@@ -0,0 +1,159 @@
+import sys
+import mmap
+import struct
+import zlib
+from array import array
+from typing import Callable, NamedTuple, TypeVar
+from pydantic import BaseModel
+
+
+MAGIC: bytes = b"FLEETSNP"
+VERSION: int = 1
+# magic, version, kind, table count, reserved, crc32 of the payload,
+# payload size
+HEADER: struct.Struct = struct.Struct("<8sHHHHIQ")
+HEADER_SIZE: int = 32
+# Strings are stored as "I" indexes into the shared string table, whose
+# entry 0 is None
+STRING: str = "s"
+# Booleans are written as "B" and read back as bool
+BOOL: str = "?"
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+class Column(NamedTuple):
+    name: str
+    typecode: str
+
+
+def _pad(size: int) -> bytes:
+    return b"\0" * (-size % 8)
+
+
+def _encode_strings(strings: list[str]) -> bytes:
+    # Offsets count characters, not bytes: the whole table is decoded at
+    # once and cut with str slices
+    offsets: array = array("I", [0])
+    for string in strings:
+        offsets.append(offsets[-1] + len(string))
+    blob: bytes = "".join(strings).encode()
+    body: bytes = struct.pack("<II", len(strings), len(blob))\
+        + offsets.tobytes() + blob
+    return body + _pad(len(body))
+
+
+def write_snapshot(path: str, kind: int,
+                   tables: list[tuple[list[Column], dict[str, list]]]
+                   ) -> None:
+    """Write already validated rows as a binary snapshot.
+
+    Each table is a list of columns and the values of each column. Numbers
+    go in fixed-width columns (array typecodes), strings as indexes into a
+    string table shared by every column. The payload
+    is protected by a CRC32 stored in the header.
+    """
+    if sys.byteorder != "little":
+        raise ValueError("Snapshots are written little-endian only")
+    strings: dict[str | None, int] = {None: 0}
+    sections: list[bytes] = []
+    for columns, values in tables:
+        for column in columns:
+            data: list = values[column.name]
+            if column.typecode == STRING:
+                encoded: array = array("I", [
+                    strings.setdefault(value, len(strings))
+                    for value in data])
+            else:
+                encoded = array("B" if column.typecode == BOOL
+                                else column.typecode, data)
+            raw: bytes = encoded.tobytes()
+            sections.append(struct.pack("<Q", len(raw)) + raw
+                            + _pad(len(raw)))
+    payload: bytes = _encode_strings(list(strings)[1:])\
+        + b"".join(sections)
+    header: bytes = HEADER.pack(MAGIC, VERSION, kind, len(tables), 0,
+                                zlib.crc32(payload), len(payload))
+    with open(path, "wb") as snapshot:
+        snapshot.write(header + _pad(len(header)) + payload)
+
+
+def read_snapshot(path: str, kind: int,
+                  tables: list[list[Column]]) -> list[dict[str, list]]:
+    """Memory-map a snapshot and return the columns of each table.
+
+    Raises ValueError if the file isn't a snapshot of this kind and
+    version, or if its checksum doesn't match.
+    """
+    # Every view is released before the map is closed, errors included
+    with open(path, "rb") as snapshot, mmap.mmap(
+            snapshot.fileno(), 0, access=mmap.ACCESS_READ) as mapped, (
+            memoryview(mapped)) as view:
+        if len(view) < HEADER_SIZE:
+            raise ValueError("Not a fleet snapshot: file too short")
+        magic, version, file_kind, table_count, _, crc, size =\
+            HEADER.unpack(view[:HEADER.size])
+        if magic != MAGIC:
+            raise ValueError("Not a fleet snapshot: bad magic number")
+        if version != VERSION:
+            raise ValueError(f"Snapshot version {version} isn't supported"
+                             f" (expected {VERSION})")
+        if file_kind != kind or table_count != len(tables):
+            raise ValueError(f"Snapshot holds kind {file_kind}, expected"
+                             f" {kind}")
+        with view[HEADER_SIZE:] as payload:
+            if len(payload) != size or zlib.crc32(payload) != crc:
+                raise ValueError("Snapshot is corrupted: checksum mismatch")
+            return _read_tables(payload, tables)
+
+
+def _read_tables(payload: memoryview, tables: list[list[Column]]
+                 ) -> list[dict[str, list]]:
+    count, length = struct.unpack_from("<II", payload, 0)
+    with payload[8:12 + 4 * count] as raw, raw.cast("I") as cast:
+        offsets: list[int] = cast.tolist()
+    position: int = 12 + 4 * count
+    text: str = str(payload[position:position + length], "utf-8")
+    strings: list[str | None] = [None]
+    strings += [text[offsets[i]:offsets[i + 1]] for i in range(count)]
+    position += length + (-(position + length) % 8)
+
+    result: list[dict[str, list]] = []
+    for columns in tables:
+        values: dict[str, list] = {}
+        for column in columns:
+            length = struct.unpack_from("<Q", payload, position)[0]
+            position += 8
+            with payload[position:position + length] as raw:
+                if column.typecode == STRING:
+                    with raw.cast("I") as cast:
+                        values[column.name] = list(map(strings.__getitem__,
+                                                       cast.tolist()))
+                else:
+                    with raw.cast(column.typecode) as cast:
+                        values[column.name] = cast.tolist()
+            position += length + (-length % 8)
+        result.append(values)
+    return result
+
+
+def trusted_factory(model: type[Model]) -> Callable[[dict], Model]:
+    """Build `model` instances from complete dicts of already valid fields.
+
+    What model_construct() does, minus the defaults and alias lookups a
+    snapshot row never needs: it costs a fifth of it per instance.
+    """
+    if model.__private_attributes__ or model.model_config.get("extra"):
+        return lambda values: model.model_construct(**values)
+    new: Callable = object.__new__
+    set_slot: Callable = object.__setattr__
+    fields: frozenset[str] = frozenset(model.model_fields)
+
+    def build(values: dict) -> Model:
+        instance: Model = new(model)
+        set_slot(instance, "__dict__", values)
+        set_slot(instance, "__pydantic_fields_set__", set(fields))
+        set_slot(instance, "__pydantic_extra__", None)
+        set_slot(instance, "__pydantic_private__", None)
+        return instance
+    return build